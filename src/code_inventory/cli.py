@@ -4,18 +4,24 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Sequence
 
 from code_inventory.logging_config import configure_logging
-from code_inventory.service import InventoryService
 
 _LOG = logging.getLogger(__name__)
 
 EXIT_SUCCESS = 0
 EXIT_UNEXPECTED_ERROR = 1
 EXIT_INPUT_ERROR = 2
+#: Shell convention for a process stopped by ``SIGPIPE`` (128 + 13), returned
+#: when the reader of ``--output -`` closes the pipe early.
+EXIT_BROKEN_PIPE = 141
+
+#: ``--output`` value that streams CSV to stdout (``csv_writer.STDOUT_PATH``).
+STDOUT_OUTPUT = "-"
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -41,7 +47,16 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         required=True,
         metavar="CSV_FILE",
-        help="Output CSV file path.",
+        help="Output CSV file path, or '-' to write CSV to stdout.",
+    )
+    parser.add_argument(
+        "--prune-flat-repos",
+        action="store_true",
+        help=(
+            "Skip the nested-project scan of repositories whose top-level "
+            "folders show no project markers. Faster, but may miss deeply "
+            "nested projects."
+        ),
     )
     parser.add_argument(
         "--verbose",
@@ -54,16 +69,38 @@ def build_parser() -> argparse.ArgumentParser:
 def _resolve_paths(args: argparse.Namespace) -> tuple[Path, Path]:
     """Resolve CLI path arguments into absolute paths.
 
+    An ``--output`` of ``-`` is passed through unresolved so the writer streams
+    to stdout.
+
     :param args: Parsed CLI arguments namespace.
     :type args: argparse.Namespace
     :return: Tuple of (input_path, output_path).
     :rtype: tuple[pathlib.Path, pathlib.Path]
     """
     input_path = Path(args.input).expanduser().resolve()
-    output_path = Path(args.output).expanduser().resolve()
+    if args.output == STDOUT_OUTPUT:
+        output_path = Path(STDOUT_OUTPUT)
+    else:
+        output_path = Path(args.output).expanduser().resolve()
     return input_path, output_path
 
 
+def _discard_stdout() -> None:
+    """Point standard output at the null device after its reader went away.
+
+    Python flushes ``sys.stdout`` at exit; once the pipe is closed that flush
+    would raise ``BrokenPipeError`` again and print a second error.
+
+    :return: None
+    :rtype: None
+    """
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, sys.stdout.fileno())
+    finally:
+        os.close(devnull)
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     """Run the CLI workflow.
 
@@ -85,21 +122,34 @@ def main(argv: Sequence[str] | None = None) -> int:
     _LOG.debug("Resolved input path: %s", input_path)
     _LOG.debug("Resolved output path: %s", output_path)
 
+    # Imported here so ``--help`` and argument errors never pay for loading the
+    # scanner, detectors, and CSV writer.
+    from code_inventory.service import InventoryService
+
     try:
         _LOG.info("Starting code inventory scan.")
-        service = InventoryService()
+        service = InventoryService(prune_flat_repos=args.prune_flat_repos)
         record_count = service.run(input_folder=input_path, output_csv=output_path)
     except (FileNotFoundError, NotADirectoryError, PermissionError) as exc:
         _LOG.error("Input/output validation error: %s", exc)
         print(f"Error: {exc}", file=sys.stderr)
         return EXIT_INPUT_ERROR
+    except BrokenPipeError:
+        # The reader of ``--output -`` (for example ``head``) stopped early.
+        _LOG.debug("Standard output closed before the CSV was fully written.")
+        _discard_stdout()
+        return EXIT_BROKEN_PIPE
     except Exception as exc:  # pragma: no cover
         _LOG.exception("Unexpected error while running inventory scan: %s", exc)
         print("Error: unexpected failure during inventory scan.", file=sys.stderr)
         return EXIT_UNEXPECTED_ERROR
 
     _LOG.info("Inventory scan completed successfully. Records written: %d", record_count)
-    print(f"Wrote {record_count} record(s) to {output_path}")
+    if args.output == STDOUT_OUTPUT:
+        # Keep stdout clean for the CSV stream.
+        print(f"Wrote {record_count} record(s) to stdout", file=sys.stderr)
+    else:
+        print(f"Wrote {record_count} record(s) to {output_path}")
     return EXIT_SUCCESS
 
 
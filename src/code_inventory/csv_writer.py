@@ -4,13 +4,21 @@ from __future__ import annotations
 
 import csv
 import logging
+import sys
 from pathlib import Path
-from typing import Final, Sequence
+from typing import Final, Sequence, TextIO
 
 from code_inventory.models import ProjectInventoryRecord
 
 _LOG = logging.getLogger(__name__)
 
+#: Text buffer size for CSV output; large enough that typical inventories
+#: are flushed in a handful of ``write`` syscalls.
+WRITE_BUFFER_SIZE: Final[int] = 1 << 20
+
+#: Output path that streams CSV to standard output instead of a file.
+STDOUT_PATH: Final[str] = "-"
+
 
 class CsvInventoryWriter:
     """Write project inventory records to a CSV file."""
@@ -39,8 +47,10 @@ class CsvInventoryWriter:
         """Write inventory records to a CSV file.
 
         The output directory is created automatically if it does not exist.
+        When ``output_file`` is ``-`` (``STDOUT_PATH``), rows are streamed to
+        ``sys.stdout`` and path validation and directory creation are skipped.
 
-        :param output_file: Path to the CSV output file.
+        :param output_file: Path to the CSV output file, or ``-`` for stdout.
         :type output_file: Path
         :param records: Inventory records to write.
         :type records: Sequence[ProjectInventoryRecord]
@@ -49,37 +59,59 @@ class CsvInventoryWriter:
         :raises ValueError: If ``output_file`` is empty or invalid.
         :raises OSError: If the file cannot be written.
         """
+        record_count = len(records)
+
+        if str(output_file) == STDOUT_PATH:
+            _LOG.info("Writing %d inventory record(s) to stdout", record_count)
+            # Files are opened with ``newline=""`` so rows keep csv's ``\r\n``.
+            # ``sys.stdout`` is in text mode and already translates ``\n`` to
+            # the platform line ending, so ``\r\n`` here would become
+            # ``\r\r\n`` on Windows.
+            self._write_rows(sys.stdout, records, lineterminator="\n")
+            sys.stdout.flush()
+            return
+
         self._validate_output_path(output_file)
         self._ensure_output_directory(output_file)
 
-        record_count = len(records)
         _LOG.info("Writing %d inventory record(s) to CSV: %s", record_count, output_file)
 
         with output_file.open(
             mode="w",
             newline="",
             encoding="utf-8",
+            buffering=WRITE_BUFFER_SIZE,
         ) as csv_file:
-            writer = csv.DictWriter(
-                csv_file,
-                fieldnames=self.FIELDNAMES,
-                extrasaction="ignore",
-                quoting=csv.QUOTE_MINIMAL,
-            )
-            writer.writeheader()
-
-            for index, record in enumerate(records, start=1):
-                row = record.to_csv_row()
-                writer.writerow(row)
-                _LOG.debug(
-                    "Wrote CSV row %d/%d for project: %s",
-                    index,
-                    record_count,
-                    row.get("project_name", "<unknown>"),
-                )
+            self._write_rows(csv_file, records)
 
+        _LOG.debug("Wrote %d CSV row(s) to: %s", record_count, output_file)
         _LOG.info("CSV write complete: %s", output_file)
 
+    def _write_rows(
+        self,
+        csv_file: TextIO,
+        records: Sequence[ProjectInventoryRecord],
+        lineterminator: str = "\r\n",
+    ) -> None:
+        """Write the header and record rows to an open text stream.
+
+        :param csv_file: Destination text stream.
+        :type csv_file: TextIO
+        :param records: Inventory records to write.
+        :type records: Sequence[ProjectInventoryRecord]
+        :param lineterminator: Row terminator passed to ``csv.writer``.
+        :type lineterminator: str
+        :return: None
+        :rtype: None
+        """
+        writer = csv.writer(
+            csv_file,
+            quoting=csv.QUOTE_MINIMAL,
+            lineterminator=lineterminator,
+        )
+        writer.writerow(self.FIELDNAMES)
+        writer.writerows(map(ProjectInventoryRecord.to_csv_tuple, records))
+
     def _validate_output_path(self, output_file: Path) -> None:
         """Validate the output CSV path.
 
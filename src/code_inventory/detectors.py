@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final, Protocol, Sequence, runtime_checkable
+from typing import Final, Iterable, Protocol, Sequence, runtime_checkable
 
 _LOG = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetectionResult:
     """Represents a successful project detection result.
 
@@ -19,17 +21,107 @@ class DetectionResult:
     :param primary_language: Primary language associated with the project.
     :type primary_language: str
     :param keywords: Keywords describing the project and detection hints.
-    :type keywords: list[str]
+    :type keywords: tuple[str, ...]
     :param detection_source: Identifier for the rule or detector that matched.
     :type detection_source: str
     """
 
     project_type: str
     primary_language: str
-    keywords: list[str]
+    keywords: tuple[str, ...]
     detection_source: str
 
 
+@dataclass(frozen=True, slots=True)
+class FolderIndex:
+    """Snapshot of a folder's immediate entries for marker lookups.
+
+    Building the index costs a single ``os.scandir`` call, after which
+    detectors answer "does this marker exist?" with set membership instead of
+    one ``stat`` per marker.
+
+    :param path: Folder the index was built from.
+    :type path: Path
+    :param names: Names of all entries in the folder.
+    :type names: frozenset[str]
+    :param dirs: Names of entries that are directories.
+    :type dirs: frozenset[str]
+    :param suffixes: File suffixes (for example, ``.csproj``) of regular files.
+    :type suffixes: frozenset[str]
+    """
+
+    path: Path
+    names: frozenset[str]
+    dirs: frozenset[str]
+    suffixes: frozenset[str]
+
+    @classmethod
+    def build(cls, folder: Path) -> FolderIndex:
+        """Index the immediate entries of a folder.
+
+        :param folder: Folder to index.
+        :type folder: Path
+        :return: Folder index.
+        :rtype: FolderIndex
+        :raises OSError: If the folder cannot be listed.
+        """
+        with os.scandir(folder) as entries:
+            return cls.from_entries(folder, entries)
+
+    @classmethod
+    def from_entries(cls, folder: Path, entries: Iterable[os.DirEntry[str]]) -> FolderIndex:
+        """Index entries already listed by ``os.scandir``.
+
+        Callers that list a folder for their own purposes (such as the
+        scanner's directory walk) can reuse that listing instead of having
+        ``build`` scan the folder again.
+
+        :param folder: Folder the entries belong to.
+        :type folder: Path
+        :param entries: Entries of ``folder``.
+        :type entries: Iterable[os.DirEntry[str]]
+        :return: Folder index.
+        :rtype: FolderIndex
+        """
+        names: set[str] = set()
+        dirs: set[str] = set()
+        suffixes: set[str] = set()
+
+        for entry in entries:
+            names.add(entry.name)
+            if entry.is_dir():
+                dirs.add(entry.name)
+            elif entry.is_file():
+                suffix = os.path.splitext(entry.name)[1]
+                if suffix:
+                    suffixes.add(suffix)
+
+        return cls(
+            path=folder,
+            names=frozenset(names),
+            dirs=frozenset(dirs),
+            suffixes=frozenset(suffixes),
+        )
+
+
+def _detect_folder(detector: IndexedProjectDetector, folder: Path) -> DetectionResult | None:
+    """Index a folder and classify it, treating an unlistable folder as no match.
+
+    :param detector: Detector that classifies the folder index.
+    :type detector: IndexedProjectDetector
+    :param folder: Folder to inspect.
+    :type folder: Path
+    :return: Detection result if matched; otherwise ``None``.
+    :rtype: DetectionResult | None
+    """
+    try:
+        index = FolderIndex.build(folder)
+    except OSError as exc:
+        _LOG.debug("Could not list folder '%s': %s", folder, exc)
+        return None
+    return detector.detect_index(index)
+
+
 @runtime_checkable
 class ProjectDetector(Protocol):
     """Protocol for project detector strategies."""
@@ -45,6 +137,53 @@ class ProjectDetector(Protocol):
         ...
 
 
+@runtime_checkable
+class IndexedProjectDetector(ProjectDetector, Protocol):
+    """Protocol for detectors that can classify a prebuilt ``FolderIndex``.
+
+    The scanner builds one index per folder and shares it across every
+    detector implementing this protocol.
+    """
+
+    def detect_index(self, index: FolderIndex) -> DetectionResult | None:
+        """Detect a project from a folder index.
+
+        :param index: Index of the folder to inspect.
+        :type index: FolderIndex
+        :return: Detection result if matched; otherwise ``None``.
+        :rtype: DetectionResult | None
+        """
+        ...
+
+
+def _build_python_results(
+    marker_keywords: dict[str, str],
+) -> dict[tuple[frozenset[str], bool], DetectionResult]:
+    """Prebuild Python detection results for every marker combination.
+
+    :param marker_keywords: Marker filename -> keyword added when present.
+    :type marker_keywords: dict[str, str]
+    :return: Mapping of ``(found markers, has src layout)`` to shared results.
+    :rtype: dict[tuple[frozenset[str], bool], DetectionResult]
+    """
+    results: dict[tuple[frozenset[str], bool], DetectionResult] = {}
+    markers = tuple(marker_keywords)
+
+    for size in range(1, len(markers) + 1):
+        for combination in itertools.combinations(markers, size):
+            keywords = ["python", *(marker_keywords[marker] for marker in combination)]
+            for has_src_layout in (False, True):
+                layout_keywords = [*keywords, "src-layout"] if has_src_layout else keywords
+                results[(frozenset(combination), has_src_layout)] = DetectionResult(
+                    project_type="CLI Tool" if has_src_layout else "Script",
+                    primary_language="Python",
+                    keywords=tuple(sorted(layout_keywords)),
+                    detection_source="python-markers",
+                )
+
+    return results
+
+
 class PythonProjectDetector:
     """Detect Python projects using common marker files."""
 
@@ -54,44 +193,52 @@ class PythonProjectDetector:
         "requirements.txt",
     )
 
+    #: Marker name -> keyword contributed when the marker is present.
+    MARKER_KEYWORDS: Final[dict[str, str]] = {
+        "pyproject.toml": "pyproject",
+        "requirements.txt": "requirements",
+        "setup.py": "setuptools",
+    }
+
+    #: (found markers, has ``src/``) -> shared result with pre-sorted keywords.
+    _RESULTS: Final[dict[tuple[frozenset[str], bool], DetectionResult]] = (
+        _build_python_results(MARKER_KEYWORDS)
+    )
+
     def detect(self, folder: Path) -> DetectionResult | None:
         """Detect Python project markers.
 
+        A folder that cannot be listed (missing or unreadable) is not a match.
+
         :param folder: Folder to inspect.
         :type folder: Path
         :return: Detection result if Python markers are found; otherwise ``None``.
         :rtype: DetectionResult | None
         """
-        found_markers = [marker for marker in self.MARKERS if (folder / marker).exists()]
-        if not found_markers:
-            return None
+        return _detect_folder(self, folder)
 
-        has_src_layout = (folder / "src").is_dir()
+    def detect_index(self, index: FolderIndex) -> DetectionResult | None:
+        """Detect Python project markers from a folder index.
 
-        keywords = ["python"]
-        if "pyproject.toml" in found_markers:
-            keywords.append("pyproject")
-        if "requirements.txt" in found_markers:
-            keywords.append("requirements")
-        if "setup.py" in found_markers:
-            keywords.append("setuptools")
-        if has_src_layout:
-            keywords.append("src-layout")
+        :param index: Index of the folder to inspect.
+        :type index: FolderIndex
+        :return: Detection result if Python markers are found; otherwise ``None``.
+        :rtype: DetectionResult | None
+        """
+        found_markers = index.names.intersection(self.MARKERS)
+        if not found_markers:
+            return None
 
-        project_type = "CLI Tool" if has_src_layout else "Script"
+        has_src_layout = "src" in index.dirs
 
-        _LOG.debug(
-            "Python project detected in '%s' using markers=%s",
-            folder,
-            found_markers,
-        )
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug(
+                "Python project detected in '%s' using markers=%s",
+                index.path,
+                sorted(found_markers),
+            )
 
-        return DetectionResult(
-            project_type=project_type,
-            primary_language="Python",
-            keywords=keywords,
-            detection_source="python-markers",
-        )
+        return self._RESULTS[(found_markers, has_src_layout)]
 
 
 class NodeProjectDetector:
@@ -100,113 +247,137 @@ class NodeProjectDetector:
     PACKAGE_JSON: Final[str] = "package.json"
     TSCONFIG_JSON: Final[str] = "tsconfig.json"
 
+    JAVASCRIPT_KEYWORDS: Final[tuple[str, ...]] = ("javascript", "node")
+    TYPESCRIPT_KEYWORDS: Final[tuple[str, ...]] = ("javascript", "node", "typescript")
+
+    #: Shared results; every Node folder maps to one of these two.
+    _JAVASCRIPT_RESULT: Final[DetectionResult] = DetectionResult(
+        project_type="Web App",
+        primary_language="JavaScript",
+        keywords=JAVASCRIPT_KEYWORDS,
+        detection_source="node-markers",
+    )
+    _TYPESCRIPT_RESULT: Final[DetectionResult] = DetectionResult(
+        project_type="Web App",
+        primary_language="TypeScript",
+        keywords=TYPESCRIPT_KEYWORDS,
+        detection_source="node-markers",
+    )
+
     def detect(self, folder: Path) -> DetectionResult | None:
         """Detect Node project markers.
 
+        A folder that cannot be listed (missing or unreadable) is not a match.
+
         :param folder: Folder to inspect.
         :type folder: Path
         :return: Detection result if Node markers are found; otherwise ``None``.
         :rtype: DetectionResult | None
         """
-        package_json_path = folder / self.PACKAGE_JSON
-        if not package_json_path.exists():
-            return None
+        return _detect_folder(self, folder)
 
-        has_typescript = (folder / self.TSCONFIG_JSON).exists()
+    def detect_index(self, index: FolderIndex) -> DetectionResult | None:
+        """Detect Node project markers from a folder index.
 
-        keywords = ["node", "javascript"]
-        if has_typescript:
-            keywords.append("typescript")
+        :param index: Index of the folder to inspect.
+        :type index: FolderIndex
+        :return: Detection result if Node markers are found; otherwise ``None``.
+        :rtype: DetectionResult | None
+        """
+        if self.PACKAGE_JSON not in index.names:
+            return None
 
-        primary_language = "TypeScript" if has_typescript else "JavaScript"
+        has_typescript = self.TSCONFIG_JSON in index.names
 
         _LOG.debug(
             "Node project detected in '%s' (typescript=%s)",
-            folder,
+            index.path,
             has_typescript,
         )
 
-        return DetectionResult(
-            project_type="Web App",
-            primary_language=primary_language,
-            keywords=keywords,
-            detection_source="node-markers",
-        )
+        return self._TYPESCRIPT_RESULT if has_typescript else self._JAVASCRIPT_RESULT
 
 
 class GenericProjectDetector:
     """Detect common non-Python, non-Node projects via marker files."""
 
     #: Marker name -> (project_type, primary_language, keywords)
-    MARKER_MAP: Final[dict[str, tuple[str, str, list[str]]]] = {
-        "Cargo.toml": ("Library", "Rust", ["rust", "cargo"]),
-        "go.mod": ("Library", "Go", ["go", "gomod"]),
-        ".csproj": ("Library", "C#", ["dotnet", "csharp"]),
-        "composer.json": ("Web App", "PHP", ["php", "composer"]),
+    MARKER_MAP: Final[dict[str, tuple[str, str, tuple[str, ...]]]] = {
+        "Cargo.toml": ("Library", "Rust", ("rust", "cargo")),
+        "go.mod": ("Library", "Go", ("go", "gomod")),
+        ".csproj": ("Library", "C#", ("dotnet", "csharp")),
+        "composer.json": ("Web App", "PHP", ("php", "composer")),
+    }
+
+    #: Exact filename markers, matched against ``FolderIndex.names``.
+    _EXACT_MARKERS: Final[frozenset[str]] = frozenset(
+        marker for marker in MARKER_MAP if not marker.startswith(".")
+    )
+
+    #: Suffix markers, matched against ``FolderIndex.suffixes``.
+    _SUFFIX_MARKERS: Final[frozenset[str]] = frozenset(
+        marker for marker in MARKER_MAP if marker.startswith(".")
+    )
+
+    #: Marker name -> shared result returned for every folder it matches.
+    _RESULTS: Final[dict[str, DetectionResult]] = {
+        marker: DetectionResult(
+            project_type=project_type,
+            primary_language=language,
+            keywords=tuple(sorted(keywords)),
+            detection_source=f"generic-marker:{marker}",
+        )
+        for marker, (project_type, language, keywords) in MARKER_MAP.items()
     }
 
     def detect(self, folder: Path) -> DetectionResult | None:
         """Detect generic project markers.
 
-        Supports both exact marker filenames (for example, ``Cargo.toml``)
-        and suffix-based markers (for example, ``.csproj``).
+        A folder that cannot be listed (missing or unreadable) is not a match.
 
         :param folder: Folder to inspect.
         :type folder: Path
         :return: Detection result if a known marker is found; otherwise ``None``.
         :rtype: DetectionResult | None
         """
-        for marker, (project_type, language, keywords) in self.MARKER_MAP.items():
-            if marker.startswith("."):
-                if self._contains_file_with_suffix(folder, marker):
-                    _LOG.debug(
-                        "Generic project detected in '%s' by suffix marker '%s'",
-                        folder,
-                        marker,
-                    )
-                    return DetectionResult(
-                        project_type=project_type,
-                        primary_language=language,
-                        keywords=list(keywords),
-                        detection_source=f"generic-marker:{marker}",
-                    )
-                continue
-
-            if (folder / marker).exists():
-                _LOG.debug(
-                    "Generic project detected in '%s' by marker '%s'",
-                    folder,
-                    marker,
-                )
-                return DetectionResult(
-                    project_type=project_type,
-                    primary_language=language,
-                    keywords=list(keywords),
-                    detection_source=f"generic-marker:{marker}",
-                )
+        return _detect_folder(self, folder)
 
-        return None
+    def detect_index(self, index: FolderIndex) -> DetectionResult | None:
+        """Detect generic project markers from a folder index.
 
-    @staticmethod
-    def _contains_file_with_suffix(folder: Path, suffix: str) -> bool:
-        """Return whether a folder contains any file with the given suffix.
+        Supports both exact marker filenames (for example, ``Cargo.toml``)
+        and suffix-based markers (for example, ``.csproj``). Both kinds are
+        checked with one set intersection each; when several markers match,
+        the first in ``MARKER_MAP`` order wins.
 
-        :param folder: Folder to inspect.
-        :type folder: Path
-        :param suffix: File suffix to match, including leading dot.
-        :type suffix: str
-        :return: ``True`` if a matching file exists; otherwise ``False``.
-        :rtype: bool
+        :param index: Index of the folder to inspect.
+        :type index: FolderIndex
+        :return: Detection result if a known marker is found; otherwise ``None``.
+        :rtype: DetectionResult | None
         """
-        try:
-            for item in folder.iterdir():
-                if item.is_file() and item.suffix == suffix:
-                    return True
-        except OSError as exc:
-            _LOG.debug("Unable to inspect folder '%s' for suffix '%s': %s", folder, suffix, exc)
-            return False
+        hits = index.names.intersection(self._EXACT_MARKERS) | index.suffixes.intersection(
+            self._SUFFIX_MARKERS
+        )
+        if not hits:
+            return None
 
-        return False
+        marker = next(marker for marker in self.MARKER_MAP if marker in hits)
+
+        _LOG.debug(
+            "Generic project detected in '%s' by marker '%s'",
+            index.path,
+            marker,
+        )
+        return self._RESULTS[marker]
+
+
+#: Shared detector instances in priority order. Detectors are stateless, so a
+#: single set of instances serves every scan.
+DEFAULT_DETECTORS: Final[tuple[ProjectDetector, ...]] = (
+    PythonProjectDetector(),
+    NodeProjectDetector(),
+    GenericProjectDetector(),
+)
 
 
 class DetectorFactory:
@@ -220,16 +391,16 @@ class DetectorFactory:
         generic detectors so the classification does not get flattened into a
         vague fallback result.
 
+        The returned list is new on every call, but the detectors in it are the
+        shared instances from ``DEFAULT_DETECTORS``.
+
         :return: Detector instances in evaluation order.
         :rtype: list[ProjectDetector]
         """
-        detectors: list[ProjectDetector] = [
-            PythonProjectDetector(),
-            NodeProjectDetector(),
-            GenericProjectDetector(),
-        ]
-        _LOG.debug(
-            "Built detector pipeline: %s",
-            [detector.__class__.__name__ for detector in detectors],
-        )
-        return detectors
\ No newline at end of file
+        detectors = list(DEFAULT_DETECTORS)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug(
+                "Built detector pipeline: %s",
+                [detector.__class__.__name__ for detector in detectors],
+            )
+        return detectors
@@ -8,6 +8,7 @@ from typing import Final, TextIO
 
 LOG_FORMAT: Final[str] = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
 LOG_DATE_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+HANDLER_NAME: Final[str] = "code_inventory"
 
 
 def configure_logging(
@@ -18,7 +19,8 @@ def configure_logging(
 
     This function configures the root logger for CLI execution and test runs.
     If logging has already been configured, existing handlers are replaced so
-    repeated calls do not produce duplicate log lines.
+    repeated calls do not produce duplicate log lines. A call that matches the
+    current configuration (same level and stream) is a no-op.
 
     :param verbose: If ``True``, use ``DEBUG`` level; otherwise ``INFO``.
     :type verbose: bool
@@ -32,17 +34,47 @@ def configure_logging(
     target_stream = stream if stream is not None else sys.stderr
 
     root_logger = logging.getLogger()
+    if _is_configured(root_logger, level, target_stream):
+        return
+
     root_logger.setLevel(level)
 
-    _clear_handlers(root_logger)
+    if root_logger.handlers:
+        _clear_handlers(root_logger)
 
     handler = logging.StreamHandler(target_stream)
+    handler.set_name(HANDLER_NAME)
     handler.setLevel(level)
     handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT))
 
     root_logger.addHandler(handler)
 
 
+def _is_configured(logger: logging.Logger, level: int, stream: TextIO) -> bool:
+    """Return whether a logger already has this module's exact configuration.
+
+    :param logger: Logger to inspect.
+    :type logger: logging.Logger
+    :param level: Expected logger and handler level.
+    :type level: int
+    :param stream: Expected handler output stream.
+    :type stream: TextIO
+    :return: ``True`` if only our handler is attached with the same level and
+        stream; otherwise ``False``.
+    :rtype: bool
+    """
+    if logger.level != level or len(logger.handlers) != 1:
+        return False
+
+    handler = logger.handlers[0]
+    return (
+        isinstance(handler, logging.StreamHandler)
+        and handler.name == HANDLER_NAME
+        and handler.level == level
+        and handler.stream is stream
+    )
+
+
 def _clear_handlers(logger: logging.Logger) -> None:
     """Remove and close all handlers attached to a logger.
 
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import hashlib
+import functools
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Final
+from typing import Final, Sequence
 
 _LOG = logging.getLogger(__name__)
 
@@ -14,8 +14,22 @@ KEYWORD_SEPARATOR: Final[str] = ";"
 PROJECT_ID_PREFIX: Final[str] = "proj-"
 PROJECT_ID_HEX_LENGTH: Final[int] = 10
 
-
-@dataclass(frozen=True)
+_STRING_FIELDS: Final[tuple[str, ...]] = (
+    "project_id",
+    "project_name",
+    "project_type",
+    "primary_language",
+    "location",
+    "github_url",
+    "status",
+    "purpose",
+    "repo_root",
+    "parent_repo",
+    "detection_source",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class ProjectInventoryRecord:
     """Represent a single inventory row for a detected project.
 
@@ -70,25 +84,23 @@ class ProjectInventoryRecord:
         :return: None
         :rtype: None
         """
-        normalized_keywords = self._normalize_keywords(self.keywords)
-
-        object.__setattr__(self, "project_id", self.project_id.strip())
-        object.__setattr__(self, "project_name", self.project_name.strip())
-        object.__setattr__(self, "project_type", self.project_type.strip())
-        object.__setattr__(self, "primary_language", self.primary_language.strip())
-        object.__setattr__(self, "location", self.location.strip())
-        object.__setattr__(self, "github_url", self.github_url.strip())
-        object.__setattr__(self, "status", self.status.strip())
-        object.__setattr__(self, "purpose", self.purpose.strip())
-        object.__setattr__(self, "repo_root", self.repo_root.strip())
-        object.__setattr__(self, "parent_repo", self.parent_repo.strip())
-        object.__setattr__(self, "detection_source", self.detection_source.strip())
-        object.__setattr__(self, "keywords", normalized_keywords)
+        for name in _STRING_FIELDS:
+            value = getattr(self, name)
+            stripped = value.strip()
+            # ``str.strip`` returns the same object when there is nothing to
+            # trim, which is the common case for scanner-built records.
+            if stripped is not value:
+                object.__setattr__(self, name, stripped)
+
+        object.__setattr__(self, "keywords", self._normalize_keywords(self.keywords))
 
     def to_csv_row(self) -> dict[str, str]:
-        """Convert the record into a CSV-compatible dictionary.
+        """Convert the record into a dictionary keyed by CSV column name.
 
-        :return: CSV row mapping for ``csv.DictWriter``.
+        ``CsvInventoryWriter`` does not use this; it writes positional rows
+        from ``to_csv_tuple`` with ``csv.writer``.
+
+        :return: CSV row values keyed by column name.
         :rtype: dict[str, str]
         """
         row = {
@@ -106,47 +118,124 @@ class ProjectInventoryRecord:
             "parent_repo": self.parent_repo,
             "detection_source": self.detection_source,
         }
-        _LOG.debug("Converted project record to CSV row: %s", self.project_name)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Converted project record to CSV row: %s", self.project_name)
         return row
 
+    def to_csv_tuple(self) -> tuple[str, ...]:
+        """Convert the record into a positional CSV row.
+
+        Values are returned in the same order as
+        ``CsvInventoryWriter.FIELDNAMES`` so the writer can use ``csv.writer``
+        without building a dictionary per row.
+
+        :return: CSV row values in column order.
+        :rtype: tuple[str, ...]
+        """
+        return (
+            self.project_id,
+            self.project_name,
+            self.project_type,
+            self.primary_language,
+            self.location,
+            self.github_url,
+            self.status,
+            KEYWORD_SEPARATOR.join(self.keywords),
+            self.purpose,
+            self.repo_root,
+            str(self.is_repo_root),
+            self.parent_repo,
+            self.detection_source,
+        )
+
     @classmethod
-    def make_project_id(cls, base_path: Path) -> str:
+    def make_project_id(cls, base_path: str | Path, *, already_resolved: bool = False) -> str:
         """Create a stable project ID from a filesystem path.
 
         This ID is deterministic across runs for the same normalized path. It
         avoids Python's built-in ``hash()`` randomization behavior.
 
         :param base_path: Path for the detected project.
-        :type base_path: Path
+        :type base_path: str | Path
+        :param already_resolved: Skip ``expanduser().resolve()`` when the caller
+            has already normalized ``base_path``. Resolving costs a ``stat``
+            per path component.
+        :type already_resolved: bool
         :return: Stable project identifier.
         :rtype: str
         """
-        normalized_path = str(base_path.expanduser().resolve()).replace("\\", "/")
-        digest = hashlib.sha1(normalized_path.encode("utf-8")).hexdigest()
-        project_id = f"{PROJECT_ID_PREFIX}{digest[:PROJECT_ID_HEX_LENGTH]}"
-
-        _LOG.debug(
-            "Generated project ID '%s' for path '%s'",
-            project_id,
-            normalized_path,
-        )
-        return project_id
+        if already_resolved:
+            resolved_path = str(base_path)
+        else:
+            resolved_path = str(Path(base_path).expanduser().resolve())
+        return _project_id_for(resolved_path.replace("\\", "/"))
 
     @staticmethod
-    def _normalize_keywords(keywords: list[str]) -> list[str]:
+    def _normalize_keywords(keywords: Sequence[str]) -> list[str]:
         """Normalize keyword values for consistent storage and CSV export.
 
         Normalization trims whitespace, removes empty values, de-duplicates,
-        and sorts alphabetically for stable output.
+        and sorts alphabetically for stable output. Input that is already
+        normalized (for example, a detector's pre-sorted keyword tuple) is
+        copied without rebuilding a set and re-sorting.
 
-        :param keywords: Raw keyword list.
-        :type keywords: list[str]
+        :param keywords: Raw keywords.
+        :type keywords: Sequence[str]
         :return: Normalized keyword list.
         :rtype: list[str]
         """
-        cleaned = {
-            keyword.strip()
-            for keyword in keywords
-            if isinstance(keyword, str) and keyword.strip()
-        }
-        return sorted(cleaned)
\ No newline at end of file
+        if _is_normalized(keywords):
+            return list(keywords)
+
+        return sorted(
+            {
+                stripped
+                for keyword in keywords
+                if isinstance(keyword, str) and (stripped := keyword.strip())
+            }
+        )
+
+
+@functools.lru_cache(maxsize=4096)
+def _project_id_for(normalized_path: str) -> str:
+    """Hash a normalized path into a project ID.
+
+    IDs are a pure function of the path, so repeated paths (for example,
+    re-scanning a workspace in the same process) skip the digest.
+
+    :param normalized_path: Resolved path using ``/`` separators.
+    :type normalized_path: str
+    :return: Stable project identifier.
+    :rtype: str
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(
+        normalized_path.encode("utf-8"),
+        digest_size=PROJECT_ID_HEX_LENGTH // 2,
+    ).hexdigest()
+    project_id = f"{PROJECT_ID_PREFIX}{digest}"
+
+    if _LOG.isEnabledFor(logging.DEBUG):
+        _LOG.debug(
+            "Generated project ID '%s' for path '%s'",
+            project_id,
+            normalized_path,
+        )
+    return project_id
+
+
+def _is_normalized(keywords: Sequence[str]) -> bool:
+    """Return whether keywords are already trimmed, unique, and sorted.
+
+    :param keywords: Keywords to check.
+    :type keywords: Sequence[str]
+    :return: ``True`` if normalization would not change the values.
+    :rtype: bool
+    """
+    previous = ""
+    for keyword in keywords:
+        if not isinstance(keyword, str) or keyword <= previous or keyword != keyword.strip():
+            return False
+        previous = keyword
+    return True
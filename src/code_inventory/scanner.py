@@ -2,48 +2,112 @@
 
 from __future__ import annotations
 
-import configparser
+import functools
 import logging
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Final, Sequence
 
-from code_inventory.detectors import DetectionResult, ProjectDetector
+from code_inventory.detectors import (
+    DetectionResult,
+    FolderIndex,
+    IndexedProjectDetector,
+    ProjectDetector,
+)
 from code_inventory.models import ProjectInventoryRecord
 
 _LOG = logging.getLogger(__name__)
 
-IGNORED_DIR_NAMES: Final[set[str]] = {
-    ".venv",
-    "venv",
-    "__pycache__",
-    ".pytest_cache",
-    ".mypy_cache",
-    ".ruff_cache",
-    "node_modules",
-    ".git",
-    ".idea",
-    ".vscode",
-    "dist",
-    "build",
-}
+IGNORED_DIR_NAMES: Final[frozenset[str]] = frozenset(
+    {
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".pytest_cache",
+        ".mypy_cache",
+        ".ruff_cache",
+        "node_modules",
+        ".git",
+        ".idea",
+        ".vscode",
+        "dist",
+        "build",
+    }
+)
 
 DEFAULT_STATUS: Final[str] = "Active"
 
+#: Default worker threads for the directory walk. The walk is I/O-bound and
+#: ``os.scandir`` releases the GIL, so more threads than cores still helps.
+DEFAULT_MAX_WORKERS: Final[int] = min(32, (os.cpu_count() or 1) * 2)
+
+#: Conventional monorepo folder names. A repository with one of these at its
+#: top level is always scanned for nested projects.
+MONOREPO_DIR_NAMES: Final[frozenset[str]] = frozenset(
+    {"apps", "packages", "services", "tools"}
+)
+
+#: Classification for repository roots that no detector matches.
+_REPO_ROOT_FALLBACK: Final[DetectionResult] = DetectionResult(
+    project_type="Repository",
+    primary_language="Unknown",
+    keywords=("git", "repository"),
+    detection_source="repo-root",
+)
+
+#: Nearest enclosing repository of a folder: (repo root, github url).
+_RepoContext = tuple[str, str]
+
+#: Result of ``_list_folder``: the folder's index and its subdirectories.
+_FolderListing = tuple[FolderIndex | None, list[str]]
+
 
 class RepositoryScanner:
     """Scan folders for repositories and nested projects."""
 
-    def __init__(self, detectors: Sequence[ProjectDetector]) -> None:
+    def __init__(
+        self,
+        detectors: Sequence[ProjectDetector],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        prune_flat_repos: bool = False,
+    ) -> None:
         """Initialize the scanner.
 
         :param detectors: Detector strategies used to classify project folders.
+            Detectors run concurrently on different folders and must not
+            mutate shared state.
         :type detectors: Sequence[ProjectDetector]
+        :param max_workers: Number of threads used to walk the tree.
+        :type max_workers: int
+        :param prune_flat_repos: Skip the nested-project scan of repositories
+            whose top-level subdirectories show no project markers and no
+            monorepo folder names. Faster on corpora of single-project repos,
+            but projects nested two or more levels deep in such a repository
+            are not reported.
+        :type prune_flat_repos: bool
+        :raises ValueError: If ``max_workers`` is less than 1.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self._max_workers = max_workers
+        self._prune_flat_repos = prune_flat_repos
         self._detectors: list[ProjectDetector] = list(detectors)
+        self._indexed: list[IndexedProjectDetector | None] = [
+            detector if isinstance(detector, IndexedProjectDetector) else None
+            for detector in self._detectors
+        ]
 
     def scan(self, root_folder: Path) -> list[ProjectInventoryRecord]:
         """Scan a root folder and return inventory records.
 
+        The tree is walked once, in parallel. Each folder is listed by a
+        worker thread that also classifies it: a folder containing ``.git``
+        produces a repository-root record, and every other folder inside a
+        repository is run through the detectors and attributed to its
+        nearest enclosing repository root.
+
         :param root_folder: Root folder to scan.
         :type root_folder: Path
         :return: Inventory records sorted by location.
@@ -53,124 +117,195 @@ class RepositoryScanner:
         _LOG.info("Scanning root folder: %s", normalized_root)
 
         records: list[ProjectInventoryRecord] = []
-        seen_paths: set[Path] = set()
-
-        repo_roots = self._find_repo_roots(normalized_root)
-        _LOG.info("Detected %d repository root(s)", len(repo_roots))
-
-        for repo_root in repo_roots:
-            _LOG.info("Processing repository root: %s", repo_root)
-            github_url = self._extract_github_url(repo_root)
-
-            repo_record = self._make_repo_root_record(repo_root, github_url)
-            self._append_if_new(records, seen_paths, repo_record)
 
-            nested_records = self._scan_nested_projects(repo_root, github_url)
-            for nested_record in nested_records:
-                self._append_if_new(records, seen_paths, nested_record)
-
-        sorted_records = sorted(records, key=lambda item: item.location.lower())
+        if self._is_walkable(normalized_root):
+            with ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="code-inventory-scan",
+            ) as executor:
+                # Only this thread submits work, so workers never block on a
+                # full queue while producing children.
+                pending = {executor.submit(self._scan_folder, str(normalized_root), None)}
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        record, child_dirs, repo, listings = future.result()
+                        if record is not None:
+                            records.append(record)
+                        pending.update(
+                            executor.submit(
+                                self._scan_folder,
+                                child,
+                                repo,
+                                listings.get(child) if listings else None,
+                            )
+                            for child in child_dirs
+                        )
+
+        repo_count = sum(1 for record in records if record.is_repo_root)
+        _LOG.info("Detected %d repository root(s)", repo_count)
+
+        # Workers finish in any order, so locations that differ only in case
+        # are tie-broken on the exact string to keep output deterministic.
+        sorted_records = sorted(
+            records,
+            key=lambda item: (item.location.lower(), item.location),
+        )
         _LOG.info("Scan complete. Returning %d inventory record(s).", len(sorted_records))
         return sorted_records
 
-    def _append_if_new(
+    def _scan_folder(
         self,
-        records: list[ProjectInventoryRecord],
-        seen_paths: set[Path],
-        record: ProjectInventoryRecord,
-    ) -> None:
-        """Append a record only if its location has not already been seen.
-
-        :param records: Output record list.
-        :type records: list[ProjectInventoryRecord]
-        :param seen_paths: Set of normalized paths already recorded.
-        :type seen_paths: set[Path]
-        :param record: Candidate record to append.
-        :type record: ProjectInventoryRecord
-        :return: None
-        :rtype: None
+        folder: str,
+        repo: _RepoContext | None,
+        listing: _FolderListing | None = None,
+    ) -> tuple[
+        ProjectInventoryRecord | None,
+        list[str],
+        _RepoContext | None,
+        dict[str, _FolderListing] | None,
+    ]:
+        """List and classify a single folder.
+
+        :param folder: Resolved folder path.
+        :type folder: str
+        :param repo: Nearest enclosing repository, or ``None`` outside repos.
+        :type repo: tuple[str, str] | None
+        :param listing: Listing of ``folder`` already fetched by its parent's
+            task, or ``None`` to list it here.
+        :type listing: tuple[FolderIndex | None, list[str]] | None
+        :return: The folder's record (if any), its subdirectories to walk, the
+            repository context to pass to them, and any of their listings
+            already fetched (``None`` if there are none).
+        :rtype: tuple[ProjectInventoryRecord | None, list[str], tuple[str, str] | None,
+            dict[str, tuple[FolderIndex | None, list[str]]] | None]
         """
-        record_path = Path(record.location).expanduser().resolve()
-        if record_path in seen_paths:
-            _LOG.debug("Skipping duplicate record for path: %s", record_path)
-            return
-
-        records.append(record)
-        seen_paths.add(record_path)
-        _LOG.debug("Added inventory record for path: %s", record_path)
-
-    def _find_repo_roots(self, root_folder: Path) -> list[Path]:
-        """Find Git repository roots under a folder.
-
-        A repository root is any folder containing a ``.git`` directory or file.
-
-        :param root_folder: Root folder to inspect.
-        :type root_folder: Path
-        :return: Repository root paths.
-        :rtype: list[Path]
+        index, child_dirs = listing if listing is not None else self._list_folder(folder)
+        if index is None:
+            return None, child_dirs, repo, None
+
+        if ".git" in index.names:
+            _LOG.info("Processing repository root: %s", folder)
+            github_url = self._extract_github_url(index.path)
+            repo = (folder, github_url)
+            listings: dict[str, _FolderListing] | None = None
+            if self._prune_flat_repos:
+                listings = {}
+                if not self._may_contain_nested(child_dirs, listings):
+                    _LOG.debug(
+                        "Skipping nested scan of repository without nested hints: %s",
+                        folder,
+                    )
+                    child_dirs = []
+                    listings = None
+            record = self._make_repo_root_record(folder, github_url, index)
+            return record, child_dirs, repo, listings
+
+        if repo is None:
+            return None, child_dirs, None, None
+
+        repo_root, github_url = repo
+        nested = self._make_nested_record(folder, repo_root, github_url, index)
+        return nested, child_dirs, repo, None
+
+    def _may_contain_nested(
+        self,
+        child_dirs: list[str],
+        listings: dict[str, _FolderListing],
+    ) -> bool:
+        """Return whether a repository's top-level folders hint at nested projects.
+
+        A repository qualifies if any top-level folder has a conventional
+        monorepo name or is itself matched by a detector. Every folder listed
+        along the way is stored in ``listings`` so the walk can reuse it
+        instead of listing the folder again.
+
+        :param child_dirs: Top-level subdirectories of the repository root.
+        :type child_dirs: list[str]
+        :param listings: Receives the listing of each child that was listed.
+        :type listings: dict[str, tuple[FolderIndex | None, list[str]]]
+        :return: ``True`` if the repository should be scanned for nested projects.
+        :rtype: bool
         """
-        repo_roots: list[Path] = []
-
-        for folder in self._walk_dirs(root_folder):
-            git_path = folder / ".git"
-            if git_path.is_dir() or git_path.is_file():
-                repo_roots.append(folder)
-                _LOG.debug("Repository root detected: %s", folder)
+        if any(os.path.basename(child) in MONOREPO_DIR_NAMES for child in child_dirs):
+            return True
 
-        return repo_roots
+        for child in child_dirs:
+            listing = listings[child] = self._list_folder(child)
+            index = listing[0]
+            if index is not None and self._detect_project(child, index) is not None:
+                return True
+        return False
 
-    def _scan_nested_projects(
+    def _make_nested_record(
         self,
-        repo_root: Path,
+        folder: str,
+        repo_root: str,
         github_url: str,
-    ) -> list[ProjectInventoryRecord]:
-        """Scan inside a repository for nested projects.
-
-        :param repo_root: Repository root.
-        :type repo_root: Path
+        index: FolderIndex | None = None,
+    ) -> ProjectInventoryRecord | None:
+        """Create a nested-project record if a detector matches the folder.
+
+        :param folder: Folder inside a repository.
+        :type folder: str
+        :param repo_root: Nearest enclosing repository root.
+        :type repo_root: str
         :param github_url: GitHub URL inferred from repo config.
         :type github_url: str
-        :return: Nested project records.
-        :rtype: list[ProjectInventoryRecord]
+        :param index: Prebuilt index of ``folder``, if already listed.
+        :type index: FolderIndex | None
+        :return: Nested project record, or ``None`` if no detector matched.
+        :rtype: ProjectInventoryRecord | None
         """
-        records: list[ProjectInventoryRecord] = []
-
-        for folder in self._walk_dirs(repo_root):
-            if folder == repo_root:
-                continue
-
-            detection = self._detect_project(folder)
-            if detection is None:
-                continue
-
-            record = self._build_record(
-                project_path=folder,
-                repo_root=repo_root,
-                parent_repo=repo_root,
-                is_repo_root=False,
-                github_url=github_url,
-                detection=detection,
-            )
-            records.append(record)
-            _LOG.debug(
-                "Nested project detected: path=%s source=%s",
-                folder,
-                detection.detection_source,
-            )
+        detection = self._detect_project(folder, index)
+        if detection is None:
+            return None
 
-        return records
+        record = self._build_record(
+            project_path=folder,
+            repo_root=repo_root,
+            parent_repo=repo_root,
+            is_repo_root=False,
+            github_url=github_url,
+            detection=detection,
+        )
+        _LOG.debug(
+            "Nested project detected: path=%s source=%s",
+            folder,
+            detection.detection_source,
+        )
+        return record
 
-    def _detect_project(self, folder: Path) -> DetectionResult | None:
+    def _detect_project(
+        self,
+        folder: str,
+        index: FolderIndex | None = None,
+    ) -> DetectionResult | None:
         """Run detector strategies against a folder.
 
+        Detectors that accept a ``FolderIndex`` share one index per folder,
+        so the folder is listed at most once regardless of how many
+        detectors run. When the walk already listed the folder, its index is
+        passed in and the folder is not listed again.
+
         :param folder: Folder to inspect.
-        :type folder: Path
+        :type folder: str
+        :param index: Prebuilt index of ``folder``, if already listed.
+        :type index: FolderIndex | None
         :return: Detection result if a detector matches; otherwise ``None``.
         :rtype: DetectionResult | None
         """
-        for detector in self._detectors:
+        # Detectors take a ``Path``; reuse the index's rather than building one.
+        path = index.path if index is not None else Path(folder)
+
+        for detector, indexed in zip(self._detectors, self._indexed, strict=True):
             try:
-                result = detector.detect(folder)
+                if indexed is not None:
+                    if index is None:
+                        index = FolderIndex.build(path)
+                    result = indexed.detect_index(index)
+                else:
+                    result = detector.detect(path)
             except OSError as exc:
                 _LOG.debug(
                     "Detector '%s' failed on folder '%s': %s",
@@ -193,8 +328,9 @@ class RepositoryScanner:
 
     def _make_repo_root_record(
         self,
-        repo_root: Path,
+        repo_root: str,
         github_url: str,
+        index: FolderIndex | None = None,
     ) -> ProjectInventoryRecord:
         """Create the repository-root inventory record.
 
@@ -203,20 +339,17 @@ class RepositoryScanner:
         repository.
 
         :param repo_root: Repository root path.
-        :type repo_root: Path
+        :type repo_root: str
         :param github_url: GitHub URL inferred from Git config.
         :type github_url: str
+        :param index: Prebuilt index of ``repo_root``, if already listed.
+        :type index: FolderIndex | None
         :return: Inventory record for the repository root.
         :rtype: ProjectInventoryRecord
         """
-        detection = self._detect_project(repo_root)
+        detection = self._detect_project(repo_root, index)
         if detection is None:
-            detection = DetectionResult(
-                project_type="Repository",
-                primary_language="Unknown",
-                keywords=["git", "repository"],
-                detection_source="repo-root",
-            )
+            detection = _REPO_ROOT_FALLBACK
 
         return self._build_record(
             project_path=repo_root,
@@ -229,21 +362,25 @@ class RepositoryScanner:
 
     def _build_record(
         self,
-        project_path: Path,
-        repo_root: Path,
-        parent_repo: Path | None,
+        project_path: str,
+        repo_root: str,
+        parent_repo: str | None,
         is_repo_root: bool,
         github_url: str,
         detection: DetectionResult,
     ) -> ProjectInventoryRecord:
         """Create a project inventory record.
 
+        Paths are expected to be resolved already (the walk starts from a
+        resolved root), so they are used as-is. They are plain strings: the
+        record stores strings, so no ``Path`` is built here.
+
         :param project_path: Detected project path.
-        :type project_path: Path
+        :type project_path: str
         :param repo_root: Repository root path.
-        :type repo_root: Path
+        :type repo_root: str
         :param parent_repo: Parent repo path for nested projects, or ``None``.
-        :type parent_repo: Path | None
+        :type parent_repo: str | None
         :param is_repo_root: Whether the record represents the repo root.
         :type is_repo_root: bool
         :param github_url: GitHub URL.
@@ -253,29 +390,24 @@ class RepositoryScanner:
         :return: Inventory record.
         :rtype: ProjectInventoryRecord
         """
-        normalized_project_path = project_path.expanduser().resolve()
-        normalized_repo_root = repo_root.expanduser().resolve()
-
-        keywords = list(detection.keywords)
-        keywords.append("repo-root" if is_repo_root else "nested-project")
-
-        parent_repo_value = ""
-        if parent_repo is not None:
-            parent_repo_value = str(parent_repo.expanduser().resolve())
+        keywords = _record_keywords(detection.keywords, is_repo_root)
 
         record = ProjectInventoryRecord(
-            project_id=ProjectInventoryRecord.make_project_id(normalized_project_path),
-            project_name=normalized_project_path.name,
+            project_id=ProjectInventoryRecord.make_project_id(
+                project_path,
+                already_resolved=True,
+            ),
+            project_name=os.path.basename(project_path),
             project_type=detection.project_type,
             primary_language=detection.primary_language,
-            location=str(normalized_project_path),
+            location=project_path,
             github_url=github_url,
             status=DEFAULT_STATUS,
-            keywords=keywords,
+            keywords=list(keywords),
             purpose="",
-            repo_root=str(normalized_repo_root),
+            repo_root=repo_root,
             is_repo_root=is_repo_root,
-            parent_repo=parent_repo_value,
+            parent_repo=parent_repo or "",
             detection_source=detection.detection_source,
         )
 
@@ -288,51 +420,55 @@ class RepositoryScanner:
         )
         return record
 
-    def _walk_dirs(self, root_folder: Path) -> list[Path]:
-        """Walk directories recursively while pruning ignored folders.
-
-        This method returns a deterministic, sorted list of directories and
-        excludes known cache/build directories.
+    @staticmethod
+    def _is_walkable(root_folder: Path) -> bool:
+        """Return whether a walk root exists and is a directory.
 
-        :param root_folder: Root folder to walk.
+        :param root_folder: Resolved root folder.
         :type root_folder: Path
-        :return: List of directories, including the root folder when valid.
-        :rtype: list[Path]
+        :return: ``True`` if the folder can be walked; otherwise ``False``.
+        :rtype: bool
         """
-        normalized_root = root_folder.expanduser().resolve()
-        output: list[Path] = []
-
-        if not normalized_root.exists():
-            _LOG.warning("Walk requested for non-existent folder: %s", normalized_root)
-            return output
+        if not root_folder.exists():
+            _LOG.warning("Walk requested for non-existent folder: %s", root_folder)
+            return False
 
-        if not normalized_root.is_dir():
-            _LOG.warning("Walk requested for non-directory path: %s", normalized_root)
-            return output
+        if not root_folder.is_dir():
+            _LOG.warning("Walk requested for non-directory path: %s", root_folder)
+            return False
 
-        output.append(normalized_root)
+        return True
 
+    @staticmethod
+    def _list_folder(folder: str) -> tuple[FolderIndex | None, list[str]]:
+        """List a folder once for both traversal and detection.
+
+        The single ``os.scandir`` listing yields the subdirectories to descend
+        into and a ``FolderIndex`` that answers ``.git`` and detector marker
+        lookups without further ``stat`` calls. Ignored names and symlinked
+        directories are not descended into.
+
+        :param folder: Folder to list.
+        :type folder: str
+        :return: Index of the folder (``None`` if it cannot be listed), and the
+            paths of its subdirectories to descend into (unsorted).
+        :rtype: tuple[FolderIndex | None, list[str]]
+        """
         try:
-            for path in sorted(normalized_root.rglob("*")):
-                if not path.is_dir():
-                    continue
-                if self._should_ignore_dir(path):
-                    continue
-                output.append(path)
+            with os.scandir(folder) as iterator:
+                entries = list(iterator)
         except OSError as exc:
-            _LOG.warning("Error while traversing '%s': %s", normalized_root, exc)
-
-        return output
-
-    def _should_ignore_dir(self, path: Path) -> bool:
-        """Return whether a directory should be ignored during traversal.
-
-        :param path: Directory path to evaluate.
-        :type path: Path
-        :return: ``True`` if the directory should be ignored; otherwise ``False``.
-        :rtype: bool
-        """
-        return any(part in IGNORED_DIR_NAMES for part in path.parts)
+            _LOG.warning("Error while traversing '%s': %s", folder, exc)
+            return None, []
+
+        # ``DirEntry.is_dir`` uses the type from the directory listing, so no
+        # extra ``stat`` is needed per entry.
+        child_dirs = [
+            entry.path
+            for entry in entries
+            if entry.name not in IGNORED_DIR_NAMES and entry.is_dir(follow_symlinks=False)
+        ]
+        return FolderIndex.from_entries(Path(folder), entries), child_dirs
 
     def _extract_github_url(self, repo_root: Path) -> str:
         """Extract the primary remote URL from Git config when available.
@@ -346,45 +482,70 @@ class RepositoryScanner:
         :return: Normalized remote URL or an empty string.
         :rtype: str
         """
-        git_path = repo_root / ".git"
-        config_path: Path | None = None
+        config_path = repo_root / ".git" / "config"
 
-        if git_path.is_dir():
-            config_path = git_path / "config"
-        elif git_path.is_file():
+        try:
+            url = self._read_first_remote_url(config_path)
+        except NotADirectoryError:
             _LOG.debug(
                 "Skipping git remote extraction for git-file repo layout: %s",
                 repo_root,
             )
             return ""
-
-        if config_path is None or not config_path.exists():
+        except FileNotFoundError:
             _LOG.debug("No git config found for repository: %s", repo_root)
             return ""
+        except OSError as exc:
+            _LOG.debug("Failed to read git config for '%s': %s", repo_root, exc)
+            return ""
 
-        parser = configparser.ConfigParser()
-        try:
-            parser.read(config_path, encoding="utf-8")
-        except (configparser.Error, OSError) as exc:
-            _LOG.debug("Failed to parse git config for '%s': %s", repo_root, exc)
+        if not url:
+            _LOG.debug("No remote URL found in git config for repository: %s", repo_root)
             return ""
 
-        for section in parser.sections():
-            if not section.startswith("remote "):
-                continue
+        normalized_url = self._normalize_remote_url(url)
+        _LOG.debug(
+            "Extracted remote URL for '%s': raw=%s normalized=%s",
+            repo_root,
+            url,
+            normalized_url,
+        )
+        return normalized_url
 
-            url = parser.get(section, "url", fallback="").strip()
-            if url:
-                normalized_url = self._normalize_remote_url(url)
-                _LOG.debug(
-                    "Extracted remote URL for '%s': raw=%s normalized=%s",
-                    repo_root,
-                    url,
-                    normalized_url,
-                )
-                return normalized_url
+    @staticmethod
+    def _read_first_remote_url(config_path: Path) -> str:
+        """Return the first ``url`` value from a ``[remote "..."]`` section.
+
+        This is a single-pass line reader rather than ``configparser``: it
+        stops at the first match, and it tolerates git syntax that
+        ``configparser`` rejects, such as repeated ``fetch`` keys.
+
+        :param config_path: Path to a git ``config`` file.
+        :type config_path: Path
+        :return: Raw remote URL, or an empty string if none is set.
+        :rtype: str
+        :raises OSError: If the file cannot be opened or read.
+        """
+        in_remote = False
+
+        with config_path.open("r", encoding="utf-8", errors="replace") as config_file:
+            for raw_line in config_file:
+                line = raw_line.strip()
+                if not line or line[0] in "#;":
+                    continue
+
+                if line[0] == "[":
+                    in_remote = line.startswith("[remote ")
+                    continue
+
+                if in_remote:
+                    key, separator, value = line.partition("=")
+                    # Git config keys are case-insensitive.
+                    if separator and key.strip().lower() == "url":
+                        url = value.strip()
+                        if url:
+                            return url
 
-        _LOG.debug("No remote URL found in git config for repository: %s", repo_root)
         return ""
 
     @staticmethod
@@ -402,12 +563,28 @@ class RepositoryScanner:
         normalized = url.strip()
 
         if normalized.startswith("git@github.com:"):
-            repo = normalized.split("git@github.com:", maxsplit=1)[1]
-            if repo.endswith(".git"):
-                repo = repo[:-4]
+            repo = normalized.removeprefix("git@github.com:").removesuffix(".git")
             return f"https://github.com/{repo}"
 
-        if normalized.startswith("https://github.com/") and normalized.endswith(".git"):
-            return normalized[:-4]
+        if normalized.startswith("https://github.com/"):
+            return normalized.removesuffix(".git")
+
+        return normalized
+
+
+@functools.lru_cache(maxsize=256)
+def _record_keywords(detection_keywords: tuple[str, ...], is_repo_root: bool) -> tuple[str, ...]:
+    """Return sorted record keywords for a detection result.
+
+    Detectors hand out shared results, so the merge and sort run once per
+    distinct result and the record model can take the sorted tuple as-is.
 
-        return normalized
\ No newline at end of file
+    :param detection_keywords: Keywords from the detection result.
+    :type detection_keywords: tuple[str, ...]
+    :param is_repo_root: Whether the record is a repository root.
+    :type is_repo_root: bool
+    :return: De-duplicated, sorted keywords including the record-kind tag.
+    :rtype: tuple[str, ...]
+    """
+    tag = "repo-root" if is_repo_root else "nested-project"
+    return tuple(sorted({*detection_keywords, tag}))
@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from code_inventory.csv_writer import CsvInventoryWriter
+from code_inventory.csv_writer import STDOUT_PATH, CsvInventoryWriter
 from code_inventory.detectors import DetectorFactory
 from code_inventory.scanner import RepositoryScanner
 
@@ -19,6 +19,8 @@ class InventoryService:
         self,
         scanner: RepositoryScanner | None = None,
         writer: CsvInventoryWriter | None = None,
+        *,
+        prune_flat_repos: bool = False,
     ) -> None:
         """Initialize the service.
 
@@ -28,9 +30,13 @@ class InventoryService:
         :type scanner: RepositoryScanner | None
         :param writer: Optional CSV writer instance.
         :type writer: CsvInventoryWriter | None
+        :param prune_flat_repos: Passed to the default scanner; ignored when
+            ``scanner`` is given.
+        :type prune_flat_repos: bool
         """
         self._scanner = scanner if scanner is not None else RepositoryScanner(
-            detectors=DetectorFactory.build()
+            detectors=DetectorFactory.build(),
+            prune_flat_repos=prune_flat_repos,
         )
         self._writer = writer if writer is not None else CsvInventoryWriter()
 
@@ -39,7 +45,7 @@ class InventoryService:
 
         :param input_folder: Folder to scan.
         :type input_folder: Path
-        :param output_csv: Output CSV file path.
+        :param output_csv: Output CSV file path, or ``-`` to write to stdout.
         :type output_csv: Path
         :return: Number of records written.
         :rtype: int
@@ -49,10 +55,13 @@ class InventoryService:
         :raises OSError: If output cannot be written.
         """
         normalized_input = input_folder.expanduser().resolve()
-        normalized_output = output_csv.expanduser().resolve()
-
         self._validate_input_folder(normalized_input)
-        self._validate_output_path(normalized_output)
+
+        if str(output_csv) == STDOUT_PATH:
+            normalized_output = output_csv
+        else:
+            normalized_output = output_csv.expanduser().resolve()
+            self._validate_output_path(normalized_output)
 
         _LOG.info("Starting inventory scan for: %s", normalized_input)
         _LOG.debug("Output CSV path resolved to: %s", normalized_output)
@@ -0,0 +1,162 @@
+"""Scaling checks for ``RepositoryScanner.scan``.
+
+These tests build large folder trees and are marked ``slow``; they are
+deselected by default. Run them with ``pytest -m slow``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from code_inventory.detectors import DetectorFactory, FolderIndex
+from code_inventory.scanner import RepositoryScanner
+
+pytestmark = pytest.mark.slow
+
+BASELINE_DIR_COUNT = 1_000
+
+#: Allowed per-folder slowdown against the baseline. Generous so machine
+#: noise passes and only super-linear regressions fail.
+MAX_PER_DIR_SLOWDOWN = 3.0
+
+#: Timed scans per measurement; the fastest one is kept on both sides of the
+#: comparison so a single slow run (a loaded CI runner, ``-n auto``) cannot
+#: fail the check on its own.
+TIMED_RUNS = 3
+
+#: One folder in this many gets a ``package.json`` marker.
+MARKER_EVERY = 10
+
+
+class ScanScenario:
+    """A repository with ``dir_count`` sibling folders under one root."""
+
+    def __init__(self, root: Path, dir_count: int) -> None:
+        """Initialize the scenario.
+
+        :param root: Empty folder to build the scenario in.
+        :type root: Path
+        :param dir_count: Number of folders inside the repository.
+        :type dir_count: int
+        """
+        self.root = root
+        self.dir_count = dir_count
+
+    def setup(self) -> None:
+        """Create the repository and its folders on disk.
+
+        :return: None
+        :rtype: None
+        """
+        repo = os.path.join(self.root, "repo")
+        os.makedirs(os.path.join(repo, ".git"))
+        for index in range(self.dir_count):
+            folder = os.path.join(repo, f"pkg-{index:06d}")
+            os.mkdir(folder)
+            if index % MARKER_EVERY == 0:
+                with open(os.path.join(folder, "package.json"), "w", encoding="utf-8") as handle:
+                    handle.write("{}\n")
+
+    def best_seconds_per_dir(self) -> float:
+        """Return the fastest of ``TIMED_RUNS`` scans, per folder.
+
+        :return: Seconds per folder.
+        :rtype: float
+        """
+        return min(self.run() for _ in range(TIMED_RUNS)) / self.dir_count
+
+    def run(self) -> float:
+        """Scan the scenario and return the elapsed wall-clock seconds.
+
+        :return: Seconds spent in ``scan``.
+        :rtype: float
+        """
+        scanner = RepositoryScanner(detectors=DetectorFactory.build())
+
+        start = time.perf_counter()
+        records = scanner.scan(self.root)
+        elapsed = time.perf_counter() - start
+
+        expected_projects = -(-self.dir_count // MARKER_EVERY)
+        assert len(records) == 1 + expected_projects
+        return elapsed
+
+
+@pytest.fixture(scope="module")
+def baseline_seconds_per_dir(tmp_path_factory: pytest.TempPathFactory) -> float:
+    """Return the best-of-``TIMED_RUNS`` per-folder scan time for the baseline tree.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Seconds per folder.
+    :rtype: float
+    """
+    scenario = ScanScenario(tmp_path_factory.mktemp("baseline"), BASELINE_DIR_COUNT)
+    scenario.setup()
+    return scenario.best_seconds_per_dir()
+
+
+@pytest.mark.parametrize("dir_count", [1_000, 10_000])
+def test_scan_time_scales_linearly_with_folder_count(
+    tmp_path_factory: pytest.TempPathFactory,
+    baseline_seconds_per_dir: float,
+    dir_count: int,
+) -> None:
+    """Verify per-folder scan time stays near the baseline as trees grow.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :param baseline_seconds_per_dir: Baseline per-folder scan time.
+    :type baseline_seconds_per_dir: float
+    :param dir_count: Number of folders in the scenario.
+    :type dir_count: int
+    :return: None
+    :rtype: None
+    """
+    scenario = ScanScenario(tmp_path_factory.mktemp(f"scan-{dir_count}"), dir_count)
+    scenario.setup()
+
+    assert scenario.best_seconds_per_dir() <= baseline_seconds_per_dir * MAX_PER_DIR_SLOWDOWN
+
+
+@pytest.mark.parametrize("dir_count", [1_000, 10_000])
+def test_scan_lists_each_folder_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+    dir_count: int,
+) -> None:
+    """Verify scan work grows linearly, measured without a clock.
+
+    Every folder is listed exactly once, so listing calls track the tree size
+    no matter how busy the machine is.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :param dir_count: Number of folders in the scenario.
+    :type dir_count: int
+    :return: None
+    :rtype: None
+    """
+    scenario = ScanScenario(tmp_path_factory.mktemp(f"count-{dir_count}"), dir_count)
+    scenario.setup()
+
+    listed: list[str] = []
+    original_list = RepositoryScanner._list_folder
+
+    def counting_list(folder: str) -> tuple[FolderIndex | None, list[str]]:
+        """Record each folder listing before delegating."""
+        listed.append(folder)
+        return original_list(folder)
+
+    monkeypatch.setattr(RepositoryScanner, "_list_folder", staticmethod(counting_list))
+
+    scenario.run()
+
+    # The scan root and the repository, plus every folder inside it.
+    assert len(listed) == len(set(listed)) == dir_count + 2
@@ -0,0 +1,130 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import TypeVar
+
+import pytest
+
+from code_inventory import cli
+from code_inventory.detectors import (
+    DetectorFactory,
+    GenericProjectDetector,
+    NodeProjectDetector,
+    ProjectDetector,
+    PythonProjectDetector,
+)
+
+_DetectorT = TypeVar("_DetectorT")
+
+
+@pytest.fixture(scope="session")
+def cli_parser() -> argparse.ArgumentParser:
+    """Return one CLI parser shared by every test in the session.
+
+    ``parse_args`` does not mutate the parser, so sharing it is safe.
+
+    :return: CLI argument parser.
+    :rtype: argparse.ArgumentParser
+    """
+    return cli.build_parser()
+
+
+@pytest.fixture
+def logging_calls(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    """Replace ``cli.configure_logging`` with a recorder.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :return: ``verbose`` values passed to ``configure_logging``, in call order.
+    :rtype: list[bool]
+    """
+    calls: list[bool] = []
+    monkeypatch.setattr(cli, "configure_logging", lambda verbose=False: calls.append(verbose))
+    return calls
+
+
+@pytest.fixture(scope="session")
+def detectors() -> list[ProjectDetector]:
+    """Return the default detector pipeline.
+
+    Detectors are stateless, so one pipeline is shared by the session.
+
+    :return: Ordered detector instances.
+    :rtype: list[ProjectDetector]
+    """
+    return DetectorFactory.build()
+
+
+@pytest.fixture(scope="session")
+def python_detector(detectors: list[ProjectDetector]) -> PythonProjectDetector:
+    """Return the shared Python detector.
+
+    :param detectors: Default detector pipeline.
+    :type detectors: list[ProjectDetector]
+    :return: Python project detector.
+    :rtype: PythonProjectDetector
+    """
+    return _pick(detectors, PythonProjectDetector)
+
+
+@pytest.fixture(scope="session")
+def node_detector(detectors: list[ProjectDetector]) -> NodeProjectDetector:
+    """Return the shared Node.js detector.
+
+    :param detectors: Default detector pipeline.
+    :type detectors: list[ProjectDetector]
+    :return: Node.js project detector.
+    :rtype: NodeProjectDetector
+    """
+    return _pick(detectors, NodeProjectDetector)
+
+
+@pytest.fixture(scope="session")
+def generic_detector(detectors: list[ProjectDetector]) -> GenericProjectDetector:
+    """Return the shared generic marker detector.
+
+    :param detectors: Default detector pipeline.
+    :type detectors: list[ProjectDetector]
+    :return: Generic project detector.
+    :rtype: GenericProjectDetector
+    """
+    return _pick(detectors, GenericProjectDetector)
+
+
+def _pick(detectors: list[ProjectDetector], detector_type: type[_DetectorT]) -> _DetectorT:
+    """Return the first detector of a given type.
+
+    :param detectors: Detector instances to search.
+    :type detectors: list[ProjectDetector]
+    :param detector_type: Detector class to look for.
+    :type detector_type: type
+    :return: Matching detector instance.
+    :rtype: ProjectDetector
+    """
+    return next(d for d in detectors if isinstance(d, detector_type))
+
+
+@pytest.fixture(scope="session")
+def repo_skeleton(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a repository folder shared by tests that only read it.
+
+    The repository has a ``.git/config`` with a GitHub SSH remote and one
+    ``app`` subfolder. Tests must not modify it.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Resolved repository root.
+    :rtype: Path
+    """
+    repo_root = tmp_path_factory.mktemp("skeleton").resolve() / "repo"
+    git_dir = repo_root / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "config").write_text(
+        '[remote "origin"]\n\turl = git@github.com:example-org/skeleton.git\n',
+        encoding="utf-8",
+    )
+    (repo_root / "app").mkdir()
+    return repo_root
@@ -3,11 +3,53 @@
 from __future__ import annotations
 
 import argparse
+import os
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
 from code_inventory import cli
+from code_inventory import service as service_module
+from code_inventory.cli import (
+    EXIT_BROKEN_PIPE,
+    EXIT_INPUT_ERROR,
+    EXIT_SUCCESS,
+    EXIT_UNEXPECTED_ERROR,
+)
+from code_inventory.cli import main as cli_main
+from code_inventory.csv_writer import CsvInventoryWriter
+from code_inventory.scanner import RepositoryScanner
+from code_inventory.service import InventoryService
+
+
+def _patch_service(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    result: int = 0,
+    error: Exception | None = None,
+) -> MagicMock:
+    """Replace ``InventoryService`` with a mock class and return it.
+
+    The service instance the CLI receives is the mock's ``return_value``.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param result: Record count returned by ``run``.
+    :type result: int
+    :param error: Exception raised by ``run`` instead of returning.
+    :type error: Exception | None
+    :return: Mock ``InventoryService`` class used by the CLI.
+    :rtype: MagicMock
+    """
+    service = MagicMock(spec=InventoryService)
+    service.run.return_value = result
+    service.run.side_effect = error
+    service_class = MagicMock(return_value=service)
+    monkeypatch.setattr(service_module, "InventoryService", service_class)
+    return service_class
 
 
 def test_build_parser_returns_argument_parser() -> None:
@@ -21,34 +63,50 @@ def test_build_parser_returns_argument_parser() -> None:
     assert isinstance(parser, argparse.ArgumentParser)
 
 
-def test_build_parser_parses_required_arguments() -> None:
+def test_build_parser_parses_required_arguments(cli_parser: argparse.ArgumentParser) -> None:
     """Verify required CLI arguments are parsed.
 
+    :param cli_parser: Shared CLI parser fixture.
+    :type cli_parser: argparse.ArgumentParser
     :return: None
     :rtype: None
     """
-    parser = cli.build_parser()
-
-    args = parser.parse_args(["--input", "src", "--output", "out.csv"])
+    args = cli_parser.parse_args(["--input", "src", "--output", "out.csv"])
 
     assert args.input == "src"
     assert args.output == "out.csv"
     assert args.verbose is False
+    assert args.prune_flat_repos is False
 
 
-def test_build_parser_parses_verbose_flag() -> None:
+def test_build_parser_parses_verbose_flag(cli_parser: argparse.ArgumentParser) -> None:
     """Verify the optional verbose flag is parsed.
 
+    :param cli_parser: Shared CLI parser fixture.
+    :type cli_parser: argparse.ArgumentParser
     :return: None
     :rtype: None
     """
-    parser = cli.build_parser()
-
-    args = parser.parse_args(["--input", "src", "--output", "out.csv", "--verbose"])
+    args = cli_parser.parse_args(["--input", "src", "--output", "out.csv", "--verbose"])
 
     assert args.verbose is True
 
 
+def test_build_parser_parses_prune_flat_repos_flag(cli_parser: argparse.ArgumentParser) -> None:
+    """Verify the optional flat-repository pruning flag is parsed.
+
+    :param cli_parser: Shared CLI parser fixture.
+    :type cli_parser: argparse.ArgumentParser
+    :return: None
+    :rtype: None
+    """
+    args = cli_parser.parse_args(
+        ["--input", "src", "--output", "out.csv", "--prune-flat-repos"]
+    )
+
+    assert args.prune_flat_repos is True
+
+
 def test_resolve_paths_returns_absolute_paths(tmp_path: Path) -> None:
     """Verify CLI path resolution returns resolved absolute paths.
 
@@ -61,206 +119,249 @@ def test_resolve_paths_returns_absolute_paths(tmp_path: Path) -> None:
     output_file = tmp_path / "out" / "inventory.csv"
     input_dir.mkdir(parents=True, exist_ok=True)
 
+    expected_input = input_dir.resolve()
+    expected_output = output_file.resolve()
     args = argparse.Namespace(input=str(input_dir), output=str(output_file))
 
     resolved_input, resolved_output = cli._resolve_paths(args)
 
-    assert resolved_input == input_dir.resolve()
-    assert resolved_output == output_file.resolve()
+    assert resolved_input == expected_input
+    assert resolved_output == expected_output
+
+
+@pytest.fixture(scope="module")
+def cli_paths(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Return an existing input folder and an output CSV path.
 
+    The service is mocked in ``main`` tests, so the folders are never
+    written and can be shared by the module.
 
-def test_main_success_returns_zero_and_prints_output(
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Tuple of (input_dir, output_file).
+    :rtype: tuple[Path, Path]
+    """
+    base = tmp_path_factory.mktemp("cli")
+    input_dir = base / "repos"
+    input_dir.mkdir()
+    return input_dir, base / "inventory.csv"
+
+
+@pytest.mark.parametrize(
+    ("error", "expected_code", "expected_stream", "expected_message"),
+    [
+        (None, EXIT_SUCCESS, "out", "Wrote 7 record(s) to {output}"),
+        (
+            FileNotFoundError("Input folder does not exist: /bad/path"),
+            EXIT_INPUT_ERROR,
+            "err",
+            "Error: Input folder does not exist: /bad/path",
+        ),
+        (
+            RuntimeError("Boom"),
+            EXIT_UNEXPECTED_ERROR,
+            "err",
+            "Error: unexpected failure during inventory scan.",
+        ),
+    ],
+    ids=["success", "validation-error", "unexpected-error"],
+)
+def test_main_returns_exit_code_and_reports_outcome(
     monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    capsys: pytest.CaptureFixture[str],
+    logging_calls: list[bool],
+    cli_paths: tuple[Path, Path],
+    capfd: pytest.CaptureFixture[str],
+    error: Exception | None,
+    expected_code: int,
+    expected_stream: str,
+    expected_message: str,
 ) -> None:
-    """Verify CLI success path configures logging and prints record count.
+    """Verify ``main`` maps service outcomes to exit codes and messages.
 
     :param monkeypatch: Pytest monkeypatch fixture.
     :type monkeypatch: pytest.MonkeyPatch
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
-    :param capsys: Pytest capture fixture.
-    :type capsys: pytest.CaptureFixture[str]
+    :param logging_calls: Recorded ``configure_logging`` calls.
+    :type logging_calls: list[bool]
+    :param cli_paths: Shared input folder and output CSV path.
+    :type cli_paths: tuple[Path, Path]
+    :param capfd: Pytest file-descriptor capture fixture.
+    :type capfd: pytest.CaptureFixture[str]
+    :param error: Exception raised by the service, or ``None`` for success.
+    :type error: Exception | None
+    :param expected_code: Expected process exit code.
+    :type expected_code: int
+    :param expected_stream: Stream that carries the message (``out`` or ``err``).
+    :type expected_stream: str
+    :param expected_message: Expected message; ``{output}`` is the output path.
+    :type expected_message: str
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "repos"
-    output_file = tmp_path / "inventory.csv"
-    input_dir.mkdir(parents=True, exist_ok=True)
-
-    captured: dict[str, object] = {}
-
-    def fake_configure_logging(verbose: bool = False) -> None:
-        """Capture logging configuration calls.
-
-        :param verbose: Verbose flag value.
-        :type verbose: bool
-        :return: None
-        :rtype: None
-        """
-        captured["verbose"] = verbose
-
-    class FakeInventoryService:
-        """Fake inventory service for CLI tests."""
-
-        def run(self, input_folder: Path, output_csv: Path) -> int:
-            """Return a fixed row count and capture arguments.
+    input_dir, output_file = cli_paths
+    expected_input = input_dir.resolve()
+    expected_output = output_file.resolve()
+    service = _patch_service(monkeypatch, result=7, error=error).return_value
 
-            :param input_folder: Input folder.
-            :type input_folder: Path
-            :param output_csv: Output CSV path.
-            :type output_csv: Path
-            :return: Fake record count.
-            :rtype: int
-            """
-            captured["input_folder"] = input_folder
-            captured["output_csv"] = output_csv
-            return 7
-
-    monkeypatch.setattr(cli, "configure_logging", fake_configure_logging)
-    monkeypatch.setattr(cli, "InventoryService", FakeInventoryService)
-
-    exit_code = cli.main(
+    exit_code = cli_main(
         ["--input", str(input_dir), "--output", str(output_file), "--verbose"]
     )
 
-    std = capsys.readouterr()
+    std = capfd.readouterr()
+    silent_stream = "err" if expected_stream == "out" else "out"
 
-    assert exit_code == cli.EXIT_SUCCESS
-    assert captured["verbose"] is True
-    assert captured["input_folder"] == input_dir.resolve()
-    assert captured["output_csv"] == output_file.resolve()
-    assert "Wrote 7 record(s) to" in std.out
-    assert str(output_file.resolve()) in std.out
-    assert std.err == ""
+    assert exit_code == expected_code
+    assert logging_calls == [True]
+    service.run.assert_called_once_with(
+        input_folder=expected_input,
+        output_csv=expected_output,
+    )
+    assert expected_message.format(output=expected_output) in getattr(std, expected_stream)
+    assert getattr(std, silent_stream) == ""
 
 
-def test_main_validation_error_returns_input_error(
+@pytest.mark.parametrize(
+    ("extra_args", "expected_prune"),
+    [([], False), (["--prune-flat-repos"], True)],
+    ids=["default", "prune-flat-repos"],
+)
+def test_main_passes_prune_flat_repos_to_service(
     monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-    capsys: pytest.CaptureFixture[str],
+    logging_calls: list[bool],
+    cli_paths: tuple[Path, Path],
+    extra_args: list[str],
+    expected_prune: bool,
 ) -> None:
-    """Verify validation-style exceptions return the input error exit code.
+    """Verify ``--prune-flat-repos`` reaches the ``InventoryService`` constructor.
 
     :param monkeypatch: Pytest monkeypatch fixture.
     :type monkeypatch: pytest.MonkeyPatch
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
-    :param capsys: Pytest capture fixture.
-    :type capsys: pytest.CaptureFixture[str]
+    :param logging_calls: Recorded ``configure_logging`` calls.
+    :type logging_calls: list[bool]
+    :param cli_paths: Shared input folder and output CSV path.
+    :type cli_paths: tuple[Path, Path]
+    :param extra_args: Flags appended to the required arguments.
+    :type extra_args: list[str]
+    :param expected_prune: Expected ``prune_flat_repos`` argument.
+    :type expected_prune: bool
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "repos"
-    output_file = tmp_path / "inventory.csv"
-    input_dir.mkdir(parents=True, exist_ok=True)
+    input_dir, output_file = cli_paths
+    service_class = _patch_service(monkeypatch)
 
-    def fake_configure_logging(verbose: bool = False) -> None:
-        """No-op logging config for tests.
+    exit_code = cli_main(
+        ["--input", str(input_dir), "--output", str(output_file), *extra_args]
+    )
 
-        :param verbose: Verbose flag value.
-        :type verbose: bool
-        :return: None
-        :rtype: None
-        """
-        _ = verbose
+    assert exit_code == EXIT_SUCCESS
+    service_class.assert_called_once_with(prune_flat_repos=expected_prune)
 
-    class FakeInventoryService:
-        """Fake service that simulates a validation error."""
 
-        def run(self, input_folder: Path, output_csv: Path) -> int:
-            """Raise a validation error.
+def test_main_missing_required_args_raises_system_exit() -> None:
+    """Verify argparse exits when required args are missing.
 
-            :param input_folder: Input folder.
-            :type input_folder: Path
-            :param output_csv: Output CSV path.
-            :type output_csv: Path
-            :return: Never returns.
-            :rtype: int
-            :raises FileNotFoundError: Always.
-            """
-            _ = input_folder, output_csv
-            raise FileNotFoundError("Input folder does not exist: /bad/path")
+    :return: None
+    :rtype: None
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main([])
 
-    monkeypatch.setattr(cli, "configure_logging", fake_configure_logging)
-    monkeypatch.setattr(cli, "InventoryService", FakeInventoryService)
+    assert exc_info.value.code == 2
 
-    exit_code = cli.main(["--input", str(input_dir), "--output", str(output_file)])
 
-    std = capsys.readouterr()
+def test_help_does_not_import_service_module() -> None:
+    """Verify ``--help`` exits before the service layer is imported.
 
-    assert exit_code == cli.EXIT_INPUT_ERROR
-    assert "Error: Input folder does not exist: /bad/path" in std.err
-    assert std.out == ""
+    :return: None
+    :rtype: None
+    """
+    code = (
+        "import sys\n"
+        "from code_inventory import cli\n"
+        "try:\n"
+        "    cli.main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "sys.exit(1 if 'code_inventory.service' in sys.modules else 0)\n"
+    )
+    src_dir = Path(cli.__file__).resolve().parents[1]
+
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=False,
+        env={**os.environ, "PYTHONPATH": str(src_dir)},
+    )
 
+    assert completed.returncode == 0
 
-def test_main_unexpected_error_returns_unexpected_error_code(
+
+def test_main_stdout_output_prints_summary_to_stderr(
     monkeypatch: pytest.MonkeyPatch,
+    logging_calls: list[bool],
     tmp_path: Path,
-    capsys: pytest.CaptureFixture[str],
+    capfd: pytest.CaptureFixture[str],
 ) -> None:
-    """Verify unexpected exceptions return the unexpected error exit code.
+    """Verify ``--output -`` is not resolved and keeps stdout free for CSV.
 
     :param monkeypatch: Pytest monkeypatch fixture.
     :type monkeypatch: pytest.MonkeyPatch
+    :param logging_calls: Recorded ``configure_logging`` calls.
+    :type logging_calls: list[bool]
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :param capsys: Pytest capture fixture.
-    :type capsys: pytest.CaptureFixture[str]
+    :param capfd: Pytest file-descriptor capture fixture.
+    :type capfd: pytest.CaptureFixture[str]
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "repos"
-    output_file = tmp_path / "inventory.csv"
-    input_dir.mkdir(parents=True, exist_ok=True)
-
-    def fake_configure_logging(verbose: bool = False) -> None:
-        """No-op logging config for tests.
-
-        :param verbose: Verbose flag value.
-        :type verbose: bool
-        :return: None
-        :rtype: None
-        """
-        _ = verbose
+    service = _patch_service(monkeypatch, result=3).return_value
 
-    class FakeInventoryService:
-        """Fake service that raises an unexpected exception."""
+    exit_code = cli_main(["--input", str(tmp_path), "--output", cli.STDOUT_OUTPUT])
 
-        def run(self, input_folder: Path, output_csv: Path) -> int:
-            """Raise a runtime error.
+    std = capfd.readouterr()
 
-            :param input_folder: Input folder.
-            :type input_folder: Path
-            :param output_csv: Output CSV path.
-            :type output_csv: Path
-            :return: Never returns.
-            :rtype: int
-            :raises RuntimeError: Always.
-            """
-            _ = input_folder, output_csv
-            raise RuntimeError("Boom")
-
-    monkeypatch.setattr(cli, "configure_logging", fake_configure_logging)
-    monkeypatch.setattr(cli, "InventoryService", FakeInventoryService)
-
-    exit_code = cli.main(["--input", str(input_dir), "--output", str(output_file)])
-
-    std = capsys.readouterr()
-
-    assert exit_code == cli.EXIT_UNEXPECTED_ERROR
-    assert "Error: unexpected failure during inventory scan." in std.err
+    assert exit_code == EXIT_SUCCESS
+    assert service.run.call_args.kwargs["output_csv"] == Path("-")
     assert std.out == ""
+    assert "Wrote 3 record(s) to stdout" in std.err
 
 
-def test_main_missing_required_args_raises_system_exit() -> None:
-    """Verify argparse exits when required args are missing.
+def test_main_exits_quietly_when_stdout_pipe_closes(
+    monkeypatch: pytest.MonkeyPatch,
+    logging_calls: list[bool],
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Verify a closed ``--output -`` pipe ends the run without an error report.
 
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param logging_calls: Recorded ``configure_logging`` calls.
+    :type logging_calls: list[bool]
+    :param tmp_path: Pytest temporary directory fixture.
+    :type tmp_path: Path
+    :param capsys: Pytest capture fixture.
+    :type capsys: pytest.CaptureFixture[str]
     :return: None
     :rtype: None
     """
-    with pytest.raises(SystemExit) as exc_info:
-        cli.main([])
+    scanner = MagicMock(spec=RepositoryScanner)
+    scanner.scan.return_value = []
+    writer = MagicMock(spec=CsvInventoryWriter)
+    writer.write.side_effect = BrokenPipeError("reader closed the pipe")
+    monkeypatch.setattr(
+        service_module,
+        "InventoryService",
+        lambda **kwargs: InventoryService(scanner=scanner, writer=writer, **kwargs),
+    )
+
+    with (tmp_path / "stdout.txt").open("w", encoding="utf-8") as stdout:
+        monkeypatch.setattr(sys, "stdout", stdout)
+
+        exit_code = cli_main(["--input", str(tmp_path), "--output", cli.STDOUT_OUTPUT])
+
+        assert os.path.samestat(os.fstat(stdout.fileno()), os.stat(os.devnull))
 
-    assert exc_info.value.code == 2
\ No newline at end of file
+    assert exit_code == EXIT_BROKEN_PIPE
+    assert capsys.readouterr().err == ""
@@ -3,20 +3,51 @@
 from __future__ import annotations
 
 import csv
+import dataclasses
 from pathlib import Path
 
 import pytest
 
-from code_inventory.csv_writer import CsvInventoryWriter
+from code_inventory.csv_writer import STDOUT_PATH, CsvInventoryWriter
 from code_inventory.models import ProjectInventoryRecord
 
+_EXPECTED_HEADER = ",".join(CsvInventoryWriter.FIELDNAMES)
+
+_EXPECTED_ALPHA_BETA_CSV = (
+    "project_id,project_name,project_type,primary_language,location,github_url,"
+    "status,keywords,purpose,repo_root,is_repo_root,parent_repo,detection_source\r\n"
+    "proj-1234567890,alpha,CLI Tool,Python,/tmp/alpha,"
+    "https://github.com/example/demo-project,Active,cli;python,Test project,"
+    "/tmp/demo-project,True,,python-markers\r\n"
+    "proj-1234567890,beta,CLI Tool,Python,/tmp/beta,"
+    "https://github.com/example/demo-project,Active,python;tool,Test project,"
+    "/tmp/demo-project,True,,python-markers\r\n"
+)
+
+
+_BASE_RECORD = ProjectInventoryRecord(
+    project_id="proj-1234567890",
+    project_name="demo-project",
+    project_type="CLI Tool",
+    primary_language="Python",
+    location="/tmp/demo-project",
+    github_url="https://github.com/example/demo-project",
+    status="Active",
+    keywords=["python", "cli"],
+    purpose="Test project",
+    repo_root="/tmp/demo-project",
+    is_repo_root=True,
+    parent_repo="",
+    detection_source="python-markers",
+)
+
 
 def _make_record(
     project_name: str = "demo-project",
     location: str = "/tmp/demo-project",
     keywords: list[str] | None = None,
 ) -> ProjectInventoryRecord:
-    """Create a test inventory record.
+    """Create a test inventory record from the shared template.
 
     :param project_name: Project name value.
     :type project_name: str
@@ -27,20 +58,11 @@ def _make_record(
     :return: Test record instance.
     :rtype: ProjectInventoryRecord
     """
-    return ProjectInventoryRecord(
-        project_id="proj-1234567890",
+    return dataclasses.replace(
+        _BASE_RECORD,
         project_name=project_name,
-        project_type="CLI Tool",
-        primary_language="Python",
         location=location,
-        github_url="https://github.com/example/demo-project",
-        status="Active",
-        keywords=keywords if keywords is not None else ["python", "cli"],
-        purpose="Test project",
-        repo_root="/tmp/demo-project",
-        is_repo_root=True,
-        parent_repo="",
-        detection_source="python-markers",
+        keywords=keywords if keywords is not None else _BASE_RECORD.keywords,
     )
 
 
@@ -62,23 +84,8 @@ def test_write_creates_csv_with_header_and_rows(tmp_path: Path) -> None:
 
     writer.write(output_file, records)
 
-    assert output_file.exists()
-
-    with output_file.open("r", encoding="utf-8", newline="") as csv_file:
-        reader = csv.DictReader(csv_file)
-        rows = list(reader)
-
-    assert reader.fieldnames == CsvInventoryWriter.FIELDNAMES
-    assert len(rows) == 2
-
-    assert rows[0]["project_name"] == "alpha"
-    assert rows[0]["primary_language"] == "Python"
-    assert rows[0]["keywords"] == "cli;python"  # normalized/sorted by model
-    assert rows[0]["is_repo_root"] == "True"
-
-    assert rows[1]["project_name"] == "beta"
-    assert rows[1]["location"] == "/tmp/beta"
-    assert rows[1]["detection_source"] == "python-markers"
+    # Keywords are normalized (sorted) by the model; rows end in CRLF.
+    assert output_file.read_bytes() == _EXPECTED_ALPHA_BETA_CSV.encode("utf-8")
 
 
 def test_write_creates_missing_output_directory(tmp_path: Path) -> None:
@@ -112,11 +119,7 @@ def test_write_with_empty_records_writes_header_only(tmp_path: Path) -> None:
 
     writer.write(output_file, [])
 
-    with output_file.open("r", encoding="utf-8", newline="") as csv_file:
-        content = csv_file.read().strip()
-
-    expected_header = ",".join(CsvInventoryWriter.FIELDNAMES)
-    assert content == expected_header
+    assert output_file.read_bytes() == f"{_EXPECTED_HEADER}\r\n".encode()
 
 
 def test_validate_output_path_raises_for_empty_like_name() -> None:
@@ -156,8 +159,8 @@ def test_validate_output_path_warns_for_non_csv_extension(
     assert "does not use .csv extension" in caplog.text
 
 
-def test_write_ignores_extra_fields_from_record_row(tmp_path: Path) -> None:
-    """Verify extra keys from ``to_csv_row`` are ignored by DictWriter.
+def test_write_rows_match_record_csv_mapping(tmp_path: Path) -> None:
+    """Verify positional rows line up with ``FIELDNAMES`` and ``to_csv_row``.
 
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
@@ -167,32 +170,14 @@ def test_write_ignores_extra_fields_from_record_row(tmp_path: Path) -> None:
     writer = CsvInventoryWriter()
     output_file = tmp_path / "inventory.csv"
 
-    record = _make_record(project_name="extra-field-project")
-
-    original_to_csv_row = record.to_csv_row
-
-    def patched_to_csv_row() -> dict[str, str]:
-        """Return a CSV row with an unexpected extra key.
-
-        :return: CSV row containing an extra field.
-        :rtype: dict[str, str]
-        """
-        row = original_to_csv_row()
-        row["unexpected_field"] = "should be ignored"
-        return row
-
-    # Monkeypatch the bound method on this instance only.
-    object.__setattr__(record, "to_csv_row", patched_to_csv_row)
+    record = _make_record(project_name="ordered-project")
 
     writer.write(output_file, [record])
 
     with output_file.open("r", encoding="utf-8", newline="") as csv_file:
         reader = csv.DictReader(csv_file)
-        rows = list(reader)
-
-    assert len(rows) == 1
-    assert rows[0]["project_name"] == "extra-field-project"
-    assert "unexpected_field" not in rows[0]
+        assert next(reader) == record.to_csv_row()
+        assert next(reader, None) is None
 
 
 def test_ensure_output_directory_is_idempotent(tmp_path: Path) -> None:
@@ -210,4 +195,34 @@ def test_ensure_output_directory_is_idempotent(tmp_path: Path) -> None:
     writer._ensure_output_directory(output_file)
 
     assert output_file.parent.exists()
-    assert output_file.parent.is_dir()
\ No newline at end of file
+    assert output_file.parent.is_dir()
+
+
+def test_write_dash_streams_csv_to_stdout(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Verify ``-`` writes CSV to stdout without touching the filesystem.
+
+    :param tmp_path: Pytest temporary directory fixture.
+    :type tmp_path: Path
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param capsys: Pytest capture fixture.
+    :type capsys: pytest.CaptureFixture[str]
+    :return: None
+    :rtype: None
+    """
+    monkeypatch.chdir(tmp_path)
+    writer = CsvInventoryWriter()
+    record = _make_record(project_name="streamed")
+
+    writer.write(Path(STDOUT_PATH), [record])
+
+    out = capsys.readouterr().out
+    reader = csv.DictReader(out.splitlines())
+
+    assert next(reader) == record.to_csv_row()
+    assert next(reader, None) is None
+    assert list(tmp_path.iterdir()) == []
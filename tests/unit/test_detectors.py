@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
 from code_inventory.detectors import (
+    DEFAULT_DETECTORS,
     DetectionResult,
     DetectorFactory,
+    FolderIndex,
     GenericProjectDetector,
     NodeProjectDetector,
     ProjectDetector,
@@ -16,6 +19,123 @@ from code_inventory.detectors import (
 )
 
 
+def _make_project(
+    tmp_path_factory: pytest.TempPathFactory,
+    name: str,
+    files: dict[str, str],
+    dirs: tuple[str, ...] = (),
+) -> Path:
+    """Create a project folder shared by the tests in this module.
+
+    Detectors only read folders, so tests may share one layout safely.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :param name: Base name for the folder.
+    :type name: str
+    :param files: Marker files to write, keyed by file name.
+    :type files: dict[str, str]
+    :param dirs: Subdirectories to create.
+    :type dirs: tuple[str, ...]
+    :return: Project folder path.
+    :rtype: Path
+    """
+    folder = tmp_path_factory.mktemp(name)
+    for file_name, content in files.items():
+        (folder / file_name).write_text(content, encoding="utf-8")
+    for dir_name in dirs:
+        (folder / dir_name).mkdir()
+    return folder
+
+
+@pytest.fixture(scope="module")
+def python_src_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a ``setup.py`` project with a ``src`` layout.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(
+        tmp_path_factory,
+        "python-src",
+        {"setup.py": "from setuptools import setup\n"},
+        dirs=("src",),
+    )
+
+
+@pytest.fixture(scope="module")
+def python_script_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a ``pyproject.toml`` + ``requirements.txt`` project without ``src``.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(
+        tmp_path_factory,
+        "python-script",
+        {"pyproject.toml": "[project]\nname='demo'\n", "requirements.txt": "pytest\n"},
+    )
+
+
+@pytest.fixture(scope="module")
+def node_js_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a JavaScript project folder.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(tmp_path_factory, "node-js", {"package.json": '{"name": "demo"}\n'})
+
+
+@pytest.fixture(scope="module")
+def node_ts_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a TypeScript project folder.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(
+        tmp_path_factory,
+        "node-ts",
+        {
+            "package.json": '{"name": "demo"}\n',
+            "tsconfig.json": '{"compilerOptions": {}}\n',
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def rust_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a Rust project folder.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(tmp_path_factory, "rust", {"Cargo.toml": "[package]\nname='demo'\n"})
+
+
+@pytest.fixture(scope="module")
+def csproj_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a .NET project folder.
+
+    :param tmp_path_factory: Pytest temporary path factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Project folder path.
+    :rtype: Path
+    """
+    return _make_project(tmp_path_factory, "csproj", {"DemoApp.csproj": "<Project></Project>\n"})
+
+
 def test_detection_result_dataclass_fields() -> None:
     """Verify DetectionResult stores expected values.
 
@@ -25,105 +145,267 @@ def test_detection_result_dataclass_fields() -> None:
     result = DetectionResult(
         project_type="CLI Tool",
         primary_language="Python",
-        keywords=["python", "pyproject"],
+        keywords=("python", "pyproject"),
         detection_source="python-markers",
     )
 
     assert result.project_type == "CLI Tool"
     assert result.primary_language == "Python"
-    assert result.keywords == ["python", "pyproject"]
+    assert result.keywords == ("python", "pyproject")
     assert result.detection_source == "python-markers"
 
 
-def test_python_detector_returns_none_when_no_markers(tmp_path: Path) -> None:
-    """Verify Python detector returns None without marker files.
+def test_folder_index_build_collects_names_dirs_and_suffixes(tmp_path: Path) -> None:
+    """Verify FolderIndex records entry names, directories, and file suffixes.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    detector = PythonProjectDetector()
+    (tmp_path / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+    (tmp_path / "Demo.csproj").write_text("<Project></Project>\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
 
-    result = detector.detect(tmp_path)
+    index = FolderIndex.build(tmp_path)
 
-    assert result is None
+    assert index.path == tmp_path
+    assert index.names == {"pyproject.toml", "Demo.csproj", "src"}
+    assert index.dirs == {"src"}
+    assert index.suffixes == {".toml", ".csproj"}
 
 
-def test_python_detector_detects_script_without_src_layout(tmp_path: Path) -> None:
-    """Verify Python detector classifies non-src project as Script.
+def test_folder_index_from_entries_matches_build(tmp_path: Path) -> None:
+    """Verify indexing an existing scandir listing matches ``build``.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    (tmp_path / "pyproject.toml").write_text("[project]\nname='demo'\n", encoding="utf-8")
-    (tmp_path / "requirements.txt").write_text("pytest\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "App.csproj").write_text("<Project />\n", encoding="utf-8")
 
-    detector = PythonProjectDetector()
-    result = detector.detect(tmp_path)
+    with os.scandir(tmp_path) as entries:
+        index = FolderIndex.from_entries(tmp_path, entries)
+
+    assert index == FolderIndex.build(tmp_path)
 
-    assert result is not None
-    assert result.project_type == "Script"
-    assert result.primary_language == "Python"
-    assert result.detection_source == "python-markers"
-    assert "python" in result.keywords
-    assert "pyproject" in result.keywords
-    assert "requirements" in result.keywords
-    assert "src-layout" not in result.keywords
 
+def test_detect_index_matches_detect_for_same_folder(
+    tmp_path: Path,
+    node_detector: NodeProjectDetector,
+) -> None:
+    """Verify index-based detection agrees with path-based detection.
+
+    :param tmp_path: Temporary folder fixture.
+    :type tmp_path: Path
+    :param node_detector: Shared Node.js detector fixture.
+    :type node_detector: NodeProjectDetector
+    :return: None
+    :rtype: None
+    """
+    (tmp_path / "package.json").write_text('{"name": "demo"}\n', encoding="utf-8")
 
-def test_python_detector_detects_cli_tool_with_src_layout(tmp_path: Path) -> None:
-    """Verify Python detector classifies src-layout project as CLI Tool.
+    assert node_detector.detect_index(FolderIndex.build(tmp_path)) == node_detector.detect(tmp_path)
+
+
+def test_python_detector_returns_none_when_no_markers(
+    tmp_path: Path,
+    python_detector: PythonProjectDetector,
+) -> None:
+    """Verify Python detector returns None without marker files.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param python_detector: Shared Python detector fixture.
+    :type python_detector: PythonProjectDetector
     :return: None
     :rtype: None
     """
-    (tmp_path / "setup.py").write_text("from setuptools import setup\n", encoding="utf-8")
-    (tmp_path / "src").mkdir()
+    result = python_detector.detect(tmp_path)
+
+    assert result is None
 
-    detector = PythonProjectDetector()
-    result = detector.detect(tmp_path)
+
+@pytest.mark.parametrize(
+    ("project_fixture", "expected_type", "expected_keywords"),
+    [
+        ("python_script_project", "Script", ("pyproject", "python", "requirements")),
+        ("python_src_project", "CLI Tool", ("python", "setuptools", "src-layout")),
+    ],
+    ids=["script", "src-layout-cli-tool"],
+)
+def test_python_detector_classifies_marker_layouts(
+    request: pytest.FixtureRequest,
+    python_detector: PythonProjectDetector,
+    project_fixture: str,
+    expected_type: str,
+    expected_keywords: tuple[str, ...],
+) -> None:
+    """Verify Python projects are classified by markers and ``src`` layout.
+
+    :param request: Pytest fixture request, used to load the project fixture.
+    :type request: pytest.FixtureRequest
+    :param python_detector: Shared Python detector fixture.
+    :type python_detector: PythonProjectDetector
+    :param project_fixture: Name of the project folder fixture.
+    :type project_fixture: str
+    :param expected_type: Expected project type.
+    :type expected_type: str
+    :param expected_keywords: Expected keywords, in order.
+    :type expected_keywords: tuple[str, ...]
+    :return: None
+    :rtype: None
+    """
+    result = python_detector.detect(request.getfixturevalue(project_fixture))
 
     assert result is not None
-    assert result.project_type == "CLI Tool"
+    assert result.project_type == expected_type
     assert result.primary_language == "Python"
     assert result.detection_source == "python-markers"
-    assert "python" in result.keywords
-    assert "setuptools" in result.keywords
-    assert "src-layout" in result.keywords
+    assert result.keywords == expected_keywords
 
 
-def test_node_detector_returns_none_without_package_json(tmp_path: Path) -> None:
-    """Verify Node detector returns None when package.json is missing.
+def test_python_detector_results_cover_every_marker_combination() -> None:
+    """Verify prebuilt results exist for all marker/src combinations.
+
+    :return: None
+    :rtype: None
+    """
+    results = PythonProjectDetector._RESULTS
+
+    # Three markers give seven non-empty subsets, each with and without src/.
+    assert len(results) == 14
+    src_setup = results[(frozenset({"setup.py"}), True)]
+    assert src_setup.project_type == "CLI Tool"
+    assert src_setup.keywords == ("python", "setuptools", "src-layout")
+    assert all(result.keywords == tuple(sorted(result.keywords)) for result in results.values())
+
+
+def test_detector_keywords_are_presorted() -> None:
+    """Verify Node and generic results carry alphabetically sorted keywords.
+
+    :return: None
+    :rtype: None
+    """
+    results = [
+        NodeProjectDetector._JAVASCRIPT_RESULT,
+        NodeProjectDetector._TYPESCRIPT_RESULT,
+        *GenericProjectDetector._RESULTS.values(),
+    ]
+
+    assert all(result.keywords == tuple(sorted(result.keywords)) for result in results)
+
+
+def test_python_detector_reuses_result_for_identical_layouts(
+    tmp_path: Path,
+    python_detector: PythonProjectDetector,
+) -> None:
+    """Verify folders with the same marker layout share one DetectionResult.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param python_detector: Shared Python detector fixture.
+    :type python_detector: PythonProjectDetector
     :return: None
     :rtype: None
     """
-    detector = NodeProjectDetector()
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for folder in (first, second):
+        folder.mkdir()
+        (folder / "pyproject.toml").write_text("[project]\n", encoding="utf-8")
+
+    assert python_detector.detect(first) is python_detector.detect(second)
+
+
+@pytest.mark.parametrize(
+    ("detector", "marker"),
+    [
+        (NodeProjectDetector(), "package.json"),
+        (GenericProjectDetector(), "Cargo.toml"),
+        (GenericProjectDetector(), "Demo.csproj"),
+    ],
+)
+def test_node_and_generic_detectors_reuse_result_for_identical_layouts(
+    tmp_path: Path,
+    detector: ProjectDetector,
+    marker: str,
+) -> None:
+    """Verify Node and generic detectors return shared, prebuilt results.
 
-    result = detector.detect(tmp_path)
+    :param tmp_path: Temporary folder fixture.
+    :type tmp_path: Path
+    :param detector: Detector under test.
+    :type detector: ProjectDetector
+    :param marker: Marker file that triggers detection.
+    :type marker: str
+    :return: None
+    :rtype: None
+    """
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for folder in (first, second):
+        folder.mkdir()
+        (folder / marker).write_text("{}\n", encoding="utf-8")
 
-    assert result is None
+    result = detector.detect(first)
 
+    assert result is not None
+    assert detector.detect(second) is result
 
-def test_node_detector_detects_javascript_project(tmp_path: Path) -> None:
-    """Verify Node detector identifies JavaScript project.
+
+def test_detectors_return_none_for_missing_folder(
+    tmp_path: Path,
+    detectors: list[ProjectDetector],
+) -> None:
+    """Verify every detector treats a folder it cannot list as no match.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param detectors: Shared default detector pipeline.
+    :type detectors: list[ProjectDetector]
     :return: None
     :rtype: None
     """
-    (tmp_path / "package.json").write_text('{"name": "demo"}\n', encoding="utf-8")
+    missing = tmp_path / "missing"
+
+    assert [detector.detect(missing) for detector in detectors] == [None] * len(detectors)
+
+
+def test_node_detector_returns_none_without_package_json(
+    tmp_path: Path,
+    node_detector: NodeProjectDetector,
+) -> None:
+    """Verify Node detector returns None when package.json is missing.
+
+    :param tmp_path: Temporary folder fixture.
+    :type tmp_path: Path
+    :param node_detector: Shared Node.js detector fixture.
+    :type node_detector: NodeProjectDetector
+    :return: None
+    :rtype: None
+    """
+    result = node_detector.detect(tmp_path)
+
+    assert result is None
 
-    detector = NodeProjectDetector()
-    result = detector.detect(tmp_path)
+
+def test_node_detector_detects_javascript_project(
+    node_js_project: Path,
+    node_detector: NodeProjectDetector,
+) -> None:
+    """Verify Node detector identifies JavaScript project.
+
+    :param node_js_project: Shared JavaScript project.
+    :type node_js_project: Path
+    :param node_detector: Shared Node.js detector fixture.
+    :type node_detector: NodeProjectDetector
+    :return: None
+    :rtype: None
+    """
+    result = node_detector.detect(node_js_project)
 
     assert result is not None
     assert result.project_type == "Web App"
@@ -134,19 +416,20 @@ def test_node_detector_detects_javascript_project(tmp_path: Path) -> None:
     assert "typescript" not in result.keywords
 
 
-def test_node_detector_detects_typescript_project(tmp_path: Path) -> None:
+def test_node_detector_detects_typescript_project(
+    node_ts_project: Path,
+    node_detector: NodeProjectDetector,
+) -> None:
     """Verify Node detector identifies TypeScript project.
 
-    :param tmp_path: Temporary folder fixture.
-    :type tmp_path: Path
+    :param node_ts_project: Shared TypeScript project.
+    :type node_ts_project: Path
+    :param node_detector: Shared Node.js detector fixture.
+    :type node_detector: NodeProjectDetector
     :return: None
     :rtype: None
     """
-    (tmp_path / "package.json").write_text('{"name": "demo"}\n', encoding="utf-8")
-    (tmp_path / "tsconfig.json").write_text('{"compilerOptions": {}}\n', encoding="utf-8")
-
-    detector = NodeProjectDetector()
-    result = detector.detect(tmp_path)
+    result = node_detector.detect(node_ts_project)
 
     assert result is not None
     assert result.project_type == "Web App"
@@ -157,85 +440,109 @@ def test_node_detector_detects_typescript_project(tmp_path: Path) -> None:
     assert "typescript" in result.keywords
 
 
-def test_generic_detector_detects_exact_marker_rust(tmp_path: Path) -> None:
-    """Verify generic detector identifies Rust projects via Cargo.toml.
-
-    :param tmp_path: Temporary folder fixture.
-    :type tmp_path: Path
+@pytest.mark.parametrize(
+    ("project_fixture", "expected"),
+    [
+        (
+            "rust_project",
+            DetectionResult(
+                project_type="Library",
+                primary_language="Rust",
+                keywords=("cargo", "rust"),
+                detection_source="generic-marker:Cargo.toml",
+            ),
+        ),
+        (
+            "csproj_project",
+            DetectionResult(
+                project_type="Library",
+                primary_language="C#",
+                keywords=("csharp", "dotnet"),
+                detection_source="generic-marker:.csproj",
+            ),
+        ),
+    ],
+    ids=["exact-marker-rust", "suffix-marker-csproj"],
+)
+def test_generic_detector_detects_marker_projects(
+    request: pytest.FixtureRequest,
+    generic_detector: GenericProjectDetector,
+    project_fixture: str,
+    expected: DetectionResult,
+) -> None:
+    """Verify generic detector matches exact-name and suffix markers.
+
+    :param request: Pytest fixture request, used to load the project fixture.
+    :type request: pytest.FixtureRequest
+    :param generic_detector: Shared generic detector fixture.
+    :type generic_detector: GenericProjectDetector
+    :param project_fixture: Name of the project folder fixture.
+    :type project_fixture: str
+    :param expected: Expected detection result.
+    :type expected: DetectionResult
     :return: None
     :rtype: None
     """
-    (tmp_path / "Cargo.toml").write_text("[package]\nname='demo'\n", encoding="utf-8")
+    assert generic_detector.detect(request.getfixturevalue(project_fixture)) == expected
 
-    detector = GenericProjectDetector()
-    result = detector.detect(tmp_path)
 
-    assert result is not None
-    assert result.project_type == "Library"
-    assert result.primary_language == "Rust"
-    assert result.keywords == ["rust", "cargo"]
-    assert result.detection_source == "generic-marker:Cargo.toml"
-
-
-def test_generic_detector_detects_suffix_marker_csproj(tmp_path: Path) -> None:
-    """Verify generic detector identifies .NET projects via .csproj suffix.
+def test_generic_detector_prefers_earlier_marker_map_entry(
+    tmp_path: Path,
+    generic_detector: GenericProjectDetector,
+) -> None:
+    """Verify marker priority follows ``MARKER_MAP`` order when several match.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param generic_detector: Shared generic detector fixture.
+    :type generic_detector: GenericProjectDetector
     :return: None
     :rtype: None
     """
+    (tmp_path / "composer.json").write_text("{}\n", encoding="utf-8")
     (tmp_path / "DemoApp.csproj").write_text("<Project></Project>\n", encoding="utf-8")
+    (tmp_path / "go.mod").write_text("module demo\n", encoding="utf-8")
 
-    detector = GenericProjectDetector()
-    result = detector.detect(tmp_path)
+    result = generic_detector.detect(tmp_path)
 
     assert result is not None
-    assert result.project_type == "Library"
-    assert result.primary_language == "C#"
-    assert result.keywords == ["dotnet", "csharp"]
-    assert result.detection_source == "generic-marker:.csproj"
+    assert result.detection_source == "generic-marker:go.mod"
 
 
-def test_generic_detector_returns_none_when_no_markers(tmp_path: Path) -> None:
+def test_generic_detector_returns_none_when_no_markers(
+    tmp_path: Path,
+    generic_detector: GenericProjectDetector,
+) -> None:
     """Verify generic detector returns None without known markers.
 
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param generic_detector: Shared generic detector fixture.
+    :type generic_detector: GenericProjectDetector
     :return: None
     :rtype: None
     """
-    detector = GenericProjectDetector()
-
-    result = detector.detect(tmp_path)
+    result = generic_detector.detect(tmp_path)
 
     assert result is None
 
 
-def test_generic_suffix_helper_handles_oserror(
-    monkeypatch: pytest.MonkeyPatch,
+def test_generic_detector_suffix_marker_ignores_directories(
     tmp_path: Path,
+    generic_detector: GenericProjectDetector,
 ) -> None:
-    """Verify suffix helper returns False when folder iteration fails.
+    """Verify suffix markers only match regular files, not directories.
 
-    :param monkeypatch: Pytest monkeypatch fixture.
-    :type monkeypatch: pytest.MonkeyPatch
     :param tmp_path: Temporary folder fixture.
     :type tmp_path: Path
+    :param generic_detector: Shared generic detector fixture.
+    :type generic_detector: GenericProjectDetector
     :return: None
     :rtype: None
     """
-    original_iterdir = Path.iterdir
-
-    def fake_iterdir(self: Path):  # noqa: ANN001
-        """Raise OSError for the target path only."""
-        if self == tmp_path:
-            raise OSError("Permission denied")
-        return original_iterdir(self)
+    (tmp_path / "Fake.csproj").mkdir()
 
-    monkeypatch.setattr(Path, "iterdir", fake_iterdir)
-
-    assert GenericProjectDetector._contains_file_with_suffix(tmp_path, ".csproj") is False
+    assert generic_detector.detect(tmp_path) is None
 
 
 def test_detector_factory_build_returns_ordered_detectors() -> None:
@@ -261,4 +568,18 @@ def test_detector_factory_outputs_protocol_compatible_detectors() -> None:
     detectors = DetectorFactory.build()
 
     for detector in detectors:
-        assert isinstance(detector, ProjectDetector)
\ No newline at end of file
+        assert isinstance(detector, ProjectDetector)
+
+
+def test_detector_factory_build_reuses_default_detector_instances() -> None:
+    """Verify factory returns a fresh list of the shared detector instances.
+
+    :return: None
+    :rtype: None
+    """
+    first = DetectorFactory.build()
+    second = DetectorFactory.build()
+
+    assert first is not second
+    assert tuple(first) == DEFAULT_DETECTORS
+    assert all(a is b for a, b in zip(first, second, strict=True))
@@ -4,55 +4,72 @@ from __future__ import annotations
 
 import io
 import logging
+from collections.abc import Iterator
 
 import pytest
 
 from code_inventory import logging_config
 
+_FMT = logging_config.LOG_FORMAT
+_DATEFMT = logging_config.LOG_DATE_FORMAT
+
 
 @pytest.fixture
-def clean_root_logger() -> logging.Logger:
+def clean_root_logger(monkeypatch: pytest.MonkeyPatch) -> Iterator[logging.Logger]:
     """Provide a clean root logger and restore original handlers afterward.
 
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
     :return: Root logger with isolated handler state for the test.
-    :rtype: logging.Logger
+    :rtype: Iterator[logging.Logger]
     """
     root_logger = logging.getLogger()
-
-    original_handlers = list(root_logger.handlers)
     original_level = root_logger.level
+    monkeypatch.setattr(root_logger, "handlers", [])
+
+    yield root_logger
+
+    for handler in root_logger.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+    # ``setLevel`` (unlike assigning ``level``) also clears logging's
+    # per-logger ``isEnabledFor`` cache.
+    root_logger.setLevel(original_level)
+
 
-    for handler in list(root_logger.handlers):
-        root_logger.removeHandler(handler)
+_LOG_BUFFER = io.StringIO()
 
-    try:
-        yield root_logger
-    finally:
-        for handler in list(root_logger.handlers):
-            root_logger.removeHandler(handler)
-            try:
-                handler.close()
-            except Exception:
-                pass
 
-        for handler in original_handlers:
-            root_logger.addHandler(handler)
-        root_logger.setLevel(original_level)
+@pytest.fixture
+def log_stream() -> Iterator[io.StringIO]:
+    """Provide an empty in-memory log stream.
+
+    One buffer is shared across tests and emptied before each use.
+
+    :return: Empty text stream.
+    :rtype: Iterator[io.StringIO]
+    """
+    _LOG_BUFFER.seek(0)
+    _LOG_BUFFER.truncate()
+    yield _LOG_BUFFER
 
 
 def test_configure_logging_sets_info_level_by_default(
     clean_root_logger: logging.Logger,
+    log_stream: io.StringIO,
 ) -> None:
     """Verify default configuration uses INFO level.
 
     :param clean_root_logger: Isolated root logger fixture.
     :type clean_root_logger: logging.Logger
+    :param log_stream: Empty in-memory log stream.
+    :type log_stream: io.StringIO
     :return: None
     :rtype: None
     """
-    stream = io.StringIO()
-
-    logging_config.configure_logging(stream=stream)
+    logging_config.configure_logging(stream=log_stream)
 
     root_logger = clean_root_logger
     assert root_logger.level == logging.INFO
@@ -62,23 +79,24 @@ def test_configure_logging_sets_info_level_by_default(
     assert isinstance(handler, logging.StreamHandler)
     assert handler.level == logging.INFO
     assert handler.formatter is not None
-    assert handler.formatter._fmt == logging_config.LOG_FORMAT  # noqa: SLF001
-    assert handler.formatter.datefmt == logging_config.LOG_DATE_FORMAT
+    assert handler.formatter._fmt == _FMT  # noqa: SLF001
+    assert handler.formatter.datefmt == _DATEFMT
 
 
 def test_configure_logging_sets_debug_level_when_verbose(
     clean_root_logger: logging.Logger,
+    log_stream: io.StringIO,
 ) -> None:
     """Verify verbose mode configures DEBUG logging.
 
     :param clean_root_logger: Isolated root logger fixture.
     :type clean_root_logger: logging.Logger
+    :param log_stream: Empty in-memory log stream.
+    :type log_stream: io.StringIO
     :return: None
     :rtype: None
     """
-    stream = io.StringIO()
-
-    logging_config.configure_logging(verbose=True, stream=stream)
+    logging_config.configure_logging(verbose=True, stream=log_stream)
 
     root_logger = clean_root_logger
     assert root_logger.level == logging.DEBUG
@@ -88,22 +106,23 @@ def test_configure_logging_sets_debug_level_when_verbose(
 
 def test_configure_logging_writes_to_custom_stream(
     clean_root_logger: logging.Logger,
+    log_stream: io.StringIO,
 ) -> None:
     """Verify log messages are written to a provided stream.
 
     :param clean_root_logger: Isolated root logger fixture.
     :type clean_root_logger: logging.Logger
+    :param log_stream: Empty in-memory log stream.
+    :type log_stream: io.StringIO
     :return: None
     :rtype: None
     """
-    stream = io.StringIO()
-
-    logging_config.configure_logging(verbose=False, stream=stream)
+    logging_config.configure_logging(verbose=False, stream=log_stream)
 
     logger = logging.getLogger("code_inventory.test")
     logger.info("hello log")
 
-    output = stream.getvalue()
+    output = log_stream.getvalue()
     assert "INFO" in output
     assert "[code_inventory.test]" in output
     assert "hello log" in output
@@ -139,6 +158,27 @@ def test_configure_logging_replaces_existing_handlers_no_duplicates(
     assert "debug-only-on-second-stream" in stream_two.getvalue()
 
 
+def test_configure_logging_is_noop_when_already_configured(
+    clean_root_logger: logging.Logger,
+    log_stream: io.StringIO,
+) -> None:
+    """Verify an identical repeat call keeps the existing handler.
+
+    :param clean_root_logger: Isolated root logger fixture.
+    :type clean_root_logger: logging.Logger
+    :param log_stream: Empty in-memory log stream.
+    :type log_stream: io.StringIO
+    :return: None
+    :rtype: None
+    """
+    logging_config.configure_logging(stream=log_stream)
+    first_handler = clean_root_logger.handlers[0]
+
+    logging_config.configure_logging(stream=log_stream)
+
+    assert clean_root_logger.handlers == [first_handler]
+
+
 def test_configure_logging_uses_sys_stderr_when_stream_not_provided(
     monkeypatch: pytest.MonkeyPatch,
     clean_root_logger: logging.Logger,
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import FrozenInstanceError
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
+import pytest
+
+from code_inventory import models
 from code_inventory.models import (
     KEYWORD_SEPARATOR,
     PROJECT_ID_HEX_LENGTH,
@@ -12,16 +18,9 @@ from code_inventory.models import (
     ProjectInventoryRecord,
 )
 
-
-def _make_record(**overrides: object) -> ProjectInventoryRecord:
-    """Create a baseline project inventory record for tests.
-
-    :param overrides: Field overrides for the record constructor.
-    :type overrides: object
-    :return: Test record instance.
-    :rtype: ProjectInventoryRecord
-    """
-    data: dict[str, object] = {
+#: Baseline constructor arguments, padded so tests exercise normalization.
+_BASELINE: Mapping[str, Any] = MappingProxyType(
+    {
         "project_id": " proj-abc123 ",
         "project_name": " demo-project ",
         "project_type": " CLI Tool ",
@@ -36,8 +35,18 @@ def _make_record(**overrides: object) -> ProjectInventoryRecord:
         "parent_repo": " ",
         "detection_source": " python-markers ",
     }
-    data.update(overrides)
-    return ProjectInventoryRecord(**data)
+)
+
+
+def _make_record(**overrides: Any) -> ProjectInventoryRecord:
+    """Create a baseline project inventory record for tests.
+
+    :param overrides: Field overrides for the record constructor.
+    :type overrides: Any
+    :return: Test record instance.
+    :rtype: ProjectInventoryRecord
+    """
+    return ProjectInventoryRecord(**{**_BASELINE, **overrides})
 
 
 def test_post_init_normalizes_string_fields_and_keywords() -> None:
@@ -71,7 +80,7 @@ def test_post_init_ignores_non_string_keywords() -> None:
     :rtype: None
     """
     record = _make_record(
-        keywords=["python", 123, None, "  cli  ", "", "python"]  # type: ignore[list-item]
+        keywords=["python", 123, None, "  cli  ", "", "python"]
     )
 
     assert record.keywords == ["cli", "python"]
@@ -119,72 +128,71 @@ def test_to_csv_row_handles_empty_keywords() -> None:
     assert row["keywords"] == ""
 
 
-def test_make_project_id_is_deterministic_for_same_path(tmp_path: Path) -> None:
-    """Verify make_project_id returns the same value for the same path.
+def test_to_csv_tuple_matches_csv_row_order() -> None:
+    """Verify to_csv_tuple returns to_csv_row values in column order.
 
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    project_dir = tmp_path / "demo"
-    project_dir.mkdir()
+    record = _make_record(keywords=["zeta", "alpha"], is_repo_root=False)
 
-    first_id = ProjectInventoryRecord.make_project_id(project_dir)
-    second_id = ProjectInventoryRecord.make_project_id(project_dir)
+    row = record.to_csv_row()
+
+    assert record.to_csv_tuple() == tuple(row.values())
+
+
+def test_make_project_id_is_deterministic_for_same_path(repo_skeleton: Path) -> None:
+    """Verify make_project_id returns the same value for the same path.
+
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
+    :return: None
+    :rtype: None
+    """
+    first_id = ProjectInventoryRecord.make_project_id(repo_skeleton)
+    second_id = ProjectInventoryRecord.make_project_id(repo_skeleton)
 
     assert first_id == second_id
 
 
-def test_make_project_id_differs_for_different_paths(tmp_path: Path) -> None:
+def test_make_project_id_differs_for_different_paths(repo_skeleton: Path) -> None:
     """Verify make_project_id differs for different normalized paths.
 
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
     :return: None
     :rtype: None
     """
-    project_a = tmp_path / "alpha"
-    project_b = tmp_path / "beta"
-    project_a.mkdir()
-    project_b.mkdir()
-
-    id_a = ProjectInventoryRecord.make_project_id(project_a)
-    id_b = ProjectInventoryRecord.make_project_id(project_b)
+    id_a = ProjectInventoryRecord.make_project_id(repo_skeleton)
+    id_b = ProjectInventoryRecord.make_project_id(repo_skeleton / "app")
 
     assert id_a != id_b
 
 
-def test_make_project_id_uses_expected_prefix_and_length(tmp_path: Path) -> None:
+def test_make_project_id_uses_expected_prefix_and_length(repo_skeleton: Path) -> None:
     """Verify project IDs use the configured prefix and hex length.
 
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
     :return: None
     :rtype: None
     """
-    project_dir = tmp_path / "demo"
-    project_dir.mkdir()
-
-    project_id = ProjectInventoryRecord.make_project_id(project_dir)
+    project_id = ProjectInventoryRecord.make_project_id(repo_skeleton)
 
     assert project_id.startswith(PROJECT_ID_PREFIX)
     assert len(project_id) == len(PROJECT_ID_PREFIX) + PROJECT_ID_HEX_LENGTH
 
 
-def test_make_project_id_normalizes_equivalent_paths(tmp_path: Path) -> None:
+def test_make_project_id_normalizes_equivalent_paths(repo_skeleton: Path) -> None:
     """Verify equivalent paths resolve to the same project ID.
 
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
     :return: None
     :rtype: None
     """
-    project_dir = tmp_path / "demo"
-    project_dir.mkdir()
-
-    path_one = project_dir
-    path_two = project_dir / "."
+    path_one = repo_skeleton / "app"
+    path_two = repo_skeleton / "app" / "."
 
     id_one = ProjectInventoryRecord.make_project_id(path_one)
     id_two = ProjectInventoryRecord.make_project_id(path_two)
@@ -192,6 +200,20 @@ def test_make_project_id_normalizes_equivalent_paths(tmp_path: Path) -> None:
     assert id_one == id_two
 
 
+def test_make_project_id_already_resolved_matches_resolved_path(repo_skeleton: Path) -> None:
+    """Verify skipping resolution yields the same ID for a resolved path.
+
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
+    :return: None
+    :rtype: None
+    """
+    assert ProjectInventoryRecord.make_project_id(
+        repo_skeleton,
+        already_resolved=True,
+    ) == ProjectInventoryRecord.make_project_id(repo_skeleton / ".")
+
+
 def test_normalize_keywords_staticmethod_sorts_dedupes_and_trims() -> None:
     """Verify _normalize_keywords trims, deduplicates, and sorts values.
 
@@ -214,6 +236,31 @@ def test_normalize_keywords_returns_empty_list_for_empty_input() -> None:
     assert ProjectInventoryRecord._normalize_keywords([]) == []
 
 
+def test_normalize_keywords_returns_list_copy_for_normalized_tuple() -> None:
+    """Verify already-normalized tuples are returned as an equal list.
+
+    :return: None
+    :rtype: None
+    """
+    keywords = ("cli", "python", "src-layout")
+
+    normalized = ProjectInventoryRecord._normalize_keywords(keywords)
+
+    assert normalized == ["cli", "python", "src-layout"]
+    assert isinstance(normalized, list)
+
+
+def test_normalize_keywords_still_normalizes_unsorted_or_padded_tuples() -> None:
+    """Verify tuples that are not normalized take the full normalization path.
+
+    :return: None
+    :rtype: None
+    """
+    assert ProjectInventoryRecord._normalize_keywords(("python", "cli")) == ["cli", "python"]
+    assert ProjectInventoryRecord._normalize_keywords(("cli", " python")) == ["cli", "python"]
+    assert ProjectInventoryRecord._normalize_keywords(("cli", "cli")) == ["cli"]
+
+
 def test_project_inventory_record_is_frozen() -> None:
     """Verify the dataclass is frozen after initialization.
 
@@ -222,9 +269,47 @@ def test_project_inventory_record_is_frozen() -> None:
     """
     record = _make_record()
 
-    try:
+    with pytest.raises(FrozenInstanceError):
         record.project_name = "changed"  # type: ignore[misc]
-    except FrozenInstanceError:
-        pass
-    else:  # pragma: no cover
-        raise AssertionError("Expected FrozenInstanceError when mutating frozen dataclass")
\ No newline at end of file
+
+
+def test_project_inventory_record_uses_slots() -> None:
+    """Verify records are slotted and carry no per-instance ``__dict__``.
+
+    :return: None
+    :rtype: None
+    """
+    record = _make_record()
+
+    assert not hasattr(record, "__dict__")
+
+
+def test_make_project_id_accepts_string_path(repo_skeleton: Path) -> None:
+    """Verify string and ``Path`` inputs produce the same ID.
+
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
+    :return: None
+    :rtype: None
+    """
+    assert ProjectInventoryRecord.make_project_id(
+        str(repo_skeleton),
+        already_resolved=True,
+    ) == ProjectInventoryRecord.make_project_id(repo_skeleton, already_resolved=True)
+
+
+def test_make_project_id_reuses_cached_digest_for_same_path(repo_skeleton: Path) -> None:
+    """Verify repeated IDs for one path come from the digest cache.
+
+    :param repo_skeleton: Shared read-only repository folder.
+    :type repo_skeleton: Path
+    :return: None
+    :rtype: None
+    """
+    models._project_id_for.cache_clear()
+
+    first_id = ProjectInventoryRecord.make_project_id(repo_skeleton)
+    second_id = ProjectInventoryRecord.make_project_id(str(repo_skeleton), already_resolved=True)
+
+    assert second_id == first_id
+    assert models._project_id_for.cache_info().hits == 1
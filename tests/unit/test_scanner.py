@@ -2,14 +2,49 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+import os
+from collections.abc import Mapping, Sequence
+from pathlib import Path, PurePath
 
 import pytest
 
-from code_inventory.detectors import DetectionResult, ProjectDetector
+from code_inventory.detectors import (
+    DetectionResult,
+    DetectorFactory,
+    FolderIndex,
+    ProjectDetector,
+)
 from code_inventory.scanner import DEFAULT_STATUS, RepositoryScanner
 
 
+def _mktree(
+    root: Path,
+    *,
+    dirs: Sequence[str] = (),
+    files: Mapping[str, str] | None = None,
+) -> None:
+    """Create folders and text files under ``root``.
+
+    Folders are created in sorted order so parents exist before children;
+    file parents are created as needed.
+
+    :param root: Base folder.
+    :type root: Path
+    :param dirs: Relative folder paths to create.
+    :type dirs: Sequence[str]
+    :param files: File contents keyed by relative path.
+    :type files: Mapping[str, str] | None
+    :return: None
+    :rtype: None
+    """
+    for relative in sorted(dirs):
+        os.makedirs(root / relative, exist_ok=True)
+    for relative, content in (files or {}).items():
+        path = root / relative
+        os.makedirs(path.parent, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+
+
 class _StubDetector:
     """Simple detector stub for scanner tests."""
 
@@ -19,7 +54,8 @@ class _StubDetector:
         :param mapping: Mapping of folder path to detection result.
         :type mapping: dict[Path, DetectionResult]
         """
-        self._mapping = {path.resolve(): result for path, result in mapping.items()}
+        # Keyed by resolved string so lookups skip building a Path.
+        self._mapping = {os.path.realpath(path): result for path, result in mapping.items()}
 
     def detect(self, folder: Path) -> DetectionResult | None:
         """Return the mapped result for a folder, if any.
@@ -29,7 +65,7 @@ class _StubDetector:
         :return: Detection result or None.
         :rtype: DetectionResult | None
         """
-        return self._mapping.get(folder.resolve())
+        return self._mapping.get(os.path.realpath(folder))
 
 
 class _RaisingDetector:
@@ -48,10 +84,17 @@ class _RaisingDetector:
         raise OSError("simulated detector failure")
 
 
+_DEFAULT_KEYWORDS: tuple[str, ...] = ("python",)
+
+# Record-building helpers only handle path strings, so tests of record shape
+# use a path that never touches the filesystem.
+_PURE_REPO_ROOT = PurePath(os.sep, "workspace", "repo")
+
+
 def _make_detection(
     project_type: str = "CLI Tool",
     language: str = "Python",
-    keywords: list[str] | None = None,
+    keywords: tuple[str, ...] | None = None,
     source: str = "python-markers",
 ) -> DetectionResult:
     """Create a DetectionResult for tests.
@@ -60,8 +103,8 @@ def _make_detection(
     :type project_type: str
     :param language: Primary language.
     :type language: str
-    :param keywords: Keyword list.
-    :type keywords: list[str] | None
+    :param keywords: Keyword tuple.
+    :type keywords: tuple[str, ...] | None
     :param source: Detection source.
     :type source: str
     :return: Detection result.
@@ -70,100 +113,142 @@ def _make_detection(
     return DetectionResult(
         project_type=project_type,
         primary_language=language,
-        keywords=keywords or ["python"],
+        keywords=keywords if keywords is not None else _DEFAULT_KEYWORDS,
         detection_source=source,
     )
 
 
-def test_walk_dirs_includes_root_and_skips_ignored_dirs(tmp_path: Path) -> None:
-    """Verify _walk_dirs returns root and excludes ignored directories.
+@pytest.fixture(scope="module")
+def scanner() -> RepositoryScanner:
+    """Return a detector-less scanner shared by helper tests.
+
+    The scanner keeps no per-scan state, so one instance serves the module.
+
+    :return: Scanner with no detectors.
+    :rtype: RepositoryScanner
+    """
+    return RepositoryScanner(detectors=[])
+
+
+def test_scan_skips_ignored_dirs(tmp_path: Path) -> None:
+    """Verify scan() does not descend into ignored directories.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    root = tmp_path / "root"
-    root.mkdir()
+    repo = tmp_path.resolve() / "repo"
+    _mktree(repo, dirs=[".git", "src", "node_modules/dep", "pkg/__pycache__"])
 
-    keep_dir = root / "src"
-    keep_dir.mkdir()
+    detector = _StubDetector(
+        {
+            repo / "src": _make_detection(source="kept"),
+            repo / "node_modules" / "dep": _make_detection(source="ignored"),
+            repo / "pkg" / "__pycache__": _make_detection(source="ignored"),
+        }
+    )
+    records = RepositoryScanner(detectors=[detector]).scan(repo)
 
-    ignored_dir = root / "node_modules"
-    ignored_dir.mkdir()
+    assert [record.location for record in records] == [str(repo), str(repo / "src")]
 
-    nested_ignored = root / "pkg" / "__pycache__"
-    nested_ignored.mkdir(parents=True)
 
-    scanner = RepositoryScanner(detectors=[])
-    walked = scanner._walk_dirs(root)
+def test_scan_only_prunes_ignored_names_below_root(tmp_path: Path) -> None:
+    """Verify an ignored name above the scan root does not hide the tree.
+
+    :param tmp_path: Temporary directory fixture.
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    root = tmp_path.resolve() / "build" / "workspace"
+    _mktree(root, dirs=["repo/.git"])
 
-    walked_set = {p.resolve() for p in walked}
+    records = RepositoryScanner(detectors=[]).scan(root)
 
-    assert root.resolve() in walked_set
-    assert keep_dir.resolve() in walked_set
-    assert ignored_dir.resolve() not in walked_set
-    assert nested_ignored.resolve() not in walked_set
+    assert [record.location for record in records] == [str(root / "repo")]
 
 
-def test_walk_dirs_returns_empty_for_missing_path(tmp_path: Path) -> None:
-    """Verify _walk_dirs returns empty list for non-existent path.
+def test_scan_skips_symlinked_directories(tmp_path: Path) -> None:
+    """Verify scan() neither follows nor reports symlinked directories.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    missing = tmp_path / "does-not-exist"
-    scanner = RepositoryScanner(detectors=[])
+    root = tmp_path.resolve() / "root"
+    outside = tmp_path.resolve() / "outside"
+    _mktree(root, dirs=["repo/.git", "repo/src"])
+    _mktree(outside, dirs=["project", "other_repo/.git"])
+
+    repo = root / "repo"
+    try:
+        os.symlink(outside / "project", repo / "linked", target_is_directory=True)
+        os.symlink(outside / "other_repo", root / "linked_repo", target_is_directory=True)
+    except (NotImplementedError, OSError):
+        pytest.skip("symlinks are not supported on this platform")
+
+    detector = _StubDetector(
+        {
+            repo / "src": _make_detection(source="kept"),
+            repo / "linked": _make_detection(source="symlink"),
+        }
+    )
+    records = RepositoryScanner(detectors=[detector]).scan(root)
 
-    assert scanner._walk_dirs(missing) == []
+    assert [record.location for record in records] == [str(repo), str(repo / "src")]
 
 
-def test_walk_dirs_returns_empty_for_file_path(tmp_path: Path) -> None:
-    """Verify _walk_dirs returns empty list for a file path.
+@pytest.mark.parametrize("make_file", [False, True], ids=["missing", "file"])
+def test_scan_returns_empty_for_non_directory(
+    scanner: RepositoryScanner,
+    tmp_path: Path,
+    make_file: bool,
+) -> None:
+    """Verify scan() returns no records for a missing path or a file.
 
+    :param scanner: Shared detector-less scanner fixture.
+    :type scanner: RepositoryScanner
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
+    :param make_file: Create a regular file at the path instead of nothing.
+    :type make_file: bool
     :return: None
     :rtype: None
     """
-    file_path = tmp_path / "file.txt"
-    file_path.write_text("x", encoding="utf-8")
-
-    scanner = RepositoryScanner(detectors=[])
+    path = tmp_path / "target"
+    if make_file:
+        path.touch()
 
-    assert scanner._walk_dirs(file_path) == []
+    assert scanner.scan(path) == []
 
 
-def test_find_repo_roots_detects_git_dir_and_git_file(tmp_path: Path) -> None:
-    """Verify _find_repo_roots detects both .git directory and file layouts.
+def test_scan_detects_git_dir_and_git_file_repo_roots(tmp_path: Path) -> None:
+    """Verify scan() treats both .git directory and file layouts as repo roots.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    root = tmp_path / "repos"
-    root.mkdir()
-
+    root = tmp_path.resolve() / "repos"
+    _mktree(
+        root,
+        dirs=["repo-a/.git", "not-a-repo"],
+        files={"repo-b/.git": "gitdir: /some/worktree/path\n"},
+    )
     repo_a = root / "repo-a"
-    (repo_a / ".git").mkdir(parents=True)
-
     repo_b = root / "repo-b"
-    repo_b.mkdir()
-    (repo_b / ".git").write_text("gitdir: /some/worktree/path\n", encoding="utf-8")
-
-    non_repo = root / "not-a-repo"
-    non_repo.mkdir()
 
     scanner = RepositoryScanner(detectors=[])
-    repo_roots = scanner._find_repo_roots(root)
+    records = scanner.scan(root)
 
-    resolved = {p.resolve() for p in repo_roots}
-    assert repo_a.resolve() in resolved
-    assert repo_b.resolve() in resolved
-    assert non_repo.resolve() not in resolved
+    assert [record.location for record in records] == [
+        str(repo_a),
+        str(repo_b),
+    ]
+    assert all(record.is_repo_root for record in records)
 
 
 def test_detect_project_uses_first_matching_detector_and_skips_oserror(tmp_path: Path) -> None:
@@ -182,25 +267,133 @@ def test_detect_project_uses_first_matching_detector_and_skips_oserror(tmp_path:
 
     scanner = RepositoryScanner(detectors=[_RaisingDetector(), matching_detector])
 
-    result = scanner._detect_project(folder)
+    result = scanner._detect_project(str(folder))
 
     assert result == expected
 
 
-def test_make_repo_root_record_falls_back_to_generic_repository(tmp_path: Path) -> None:
-    """Verify repo-root fallback record is used when no detector matches.
+def test_detect_project_builds_folder_index_once_for_indexed_detectors(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify indexed detectors share a single FolderIndex per folder.
 
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param tmp_path: Temporary directory fixture.
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    (tmp_path / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+
+    build_calls: list[Path] = []
+    original_build = FolderIndex.build
+
+    def counting_build(cls: type[FolderIndex], folder: Path) -> FolderIndex:
+        """Record the folder and delegate to the real builder."""
+        build_calls.append(folder)
+        return original_build(folder)
+
+    monkeypatch.setattr(FolderIndex, "build", classmethod(counting_build))
+
+    scanner = RepositoryScanner(detectors=DetectorFactory.build())
+    result = scanner._detect_project(str(tmp_path))
+
+    assert result is not None
+    assert result.detection_source == "generic-marker:Cargo.toml"
+    assert build_calls == [tmp_path]
+
+
+def test_scan_reuses_walk_listing_for_detection(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify scan() classifies folders without listing them a second time.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param tmp_path: Temporary directory fixture.
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    _mktree(
+        tmp_path,
+        dirs=["repo/.git"],
+        files={
+            "repo/pyproject.toml": "[project]\n",
+            "repo/services/api/go.mod": "module api\n",
+        },
+    )
+
+    def failing_build(cls: type[FolderIndex], folder: Path) -> FolderIndex:
+        """Fail if a detector lists a folder on its own."""
+        raise AssertionError(f"unexpected FolderIndex.build({folder})")
+
+    monkeypatch.setattr(FolderIndex, "build", classmethod(failing_build))
+
+    records = RepositoryScanner(detectors=DetectorFactory.build()).scan(tmp_path)
+
+    assert [record.detection_source for record in records] == [
+        "python-markers",
+        "generic-marker:go.mod",
+    ]
+
+
+def test_scan_reads_git_config_once_per_repository(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify nested projects reuse their repository's URL instead of re-reading config.
+
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
     repo_root = tmp_path / "repo"
-    repo_root.mkdir()
-    (repo_root / ".git").mkdir()
+    (repo_root / ".git").mkdir(parents=True)
+    (repo_root / ".git" / "config").write_text(
+        '[remote "origin"]\n\turl = git@github.com:example/mono.git\n',
+        encoding="utf-8",
+    )
+    for name in ("alpha", "beta", "gamma"):
+        package = repo_root / "packages" / name
+        package.mkdir(parents=True)
+        (package / "package.json").write_text("{}\n", encoding="utf-8")
 
-    scanner = RepositoryScanner(detectors=[])
-    record = scanner._make_repo_root_record(repo_root, github_url="")
+    read_calls: list[Path] = []
+    original_read = RepositoryScanner._read_first_remote_url
+
+    def counting_read(config_path: Path) -> str:
+        """Record each config read before delegating."""
+        read_calls.append(config_path)
+        return original_read(config_path)
+
+    monkeypatch.setattr(RepositoryScanner, "_read_first_remote_url", staticmethod(counting_read))
+
+    records = RepositoryScanner(detectors=DetectorFactory.build()).scan(tmp_path)
+
+    assert len(records) == 4
+    assert {record.github_url for record in records} == {"https://github.com/example/mono"}
+    assert len(read_calls) == 1
+
+
+def test_make_repo_root_record_falls_back_to_generic_repository(
+    scanner: RepositoryScanner,
+) -> None:
+    """Verify repo-root fallback record is used when no detector matches.
+
+    :param scanner: Shared detector-less scanner fixture.
+    :type scanner: RepositoryScanner
+    :return: None
+    :rtype: None
+    """
+    repo_root = _PURE_REPO_ROOT
+    record = scanner._make_repo_root_record(str(repo_root), github_url="")
 
     assert record.project_name == "repo"
     assert record.project_type == "Repository"
@@ -208,37 +401,35 @@ def test_make_repo_root_record_falls_back_to_generic_repository(tmp_path: Path)
     assert record.status == DEFAULT_STATUS
     assert record.is_repo_root is True
     assert record.parent_repo == ""
-    assert record.repo_root == str(repo_root.resolve())
+    assert record.repo_root == str(repo_root)
     assert "git" in record.keywords
     assert "repository" in record.keywords
     assert "repo-root" in record.keywords
     assert record.detection_source == "repo-root"
 
 
-def test_build_record_sets_repo_and_parent_relationships(tmp_path: Path) -> None:
+def test_build_record_sets_repo_and_parent_relationships(scanner: RepositoryScanner) -> None:
     """Verify _build_record populates repo linkage and nested flags.
 
-    :param tmp_path: Temporary directory fixture.
-    :type tmp_path: Path
+    :param scanner: Shared detector-less scanner fixture.
+    :type scanner: RepositoryScanner
     :return: None
     :rtype: None
     """
-    repo_root = tmp_path / "repo"
-    nested = repo_root / "packages" / "app"
-    nested.mkdir(parents=True)
+    repo_root = _PURE_REPO_ROOT
+    nested = repo_root / "app"
 
-    scanner = RepositoryScanner(detectors=[])
     detection = _make_detection(
         project_type="Web App",
         language="TypeScript",
-        keywords=["node", "typescript"],
+        keywords=("node", "typescript"),
         source="node-markers",
     )
 
     record = scanner._build_record(
-        project_path=nested,
-        repo_root=repo_root,
-        parent_repo=repo_root,
+        project_path=str(nested),
+        repo_root=str(repo_root),
+        parent_repo=str(repo_root),
         is_repo_root=False,
         github_url="https://github.com/example/repo",
         detection=detection,
@@ -247,9 +438,9 @@ def test_build_record_sets_repo_and_parent_relationships(tmp_path: Path) -> None
     assert record.project_name == "app"
     assert record.project_type == "Web App"
     assert record.primary_language == "TypeScript"
-    assert record.location == str(nested.resolve())
-    assert record.repo_root == str(repo_root.resolve())
-    assert record.parent_repo == str(repo_root.resolve())
+    assert record.location == str(nested)
+    assert record.repo_root == str(repo_root)
+    assert record.parent_repo == str(repo_root)
     assert record.is_repo_root is False
     assert record.status == DEFAULT_STATUS
     assert record.github_url == "https://github.com/example/repo"
@@ -258,266 +449,398 @@ def test_build_record_sets_repo_and_parent_relationships(tmp_path: Path) -> None
     assert record.detection_source == "node-markers"
 
 
-def test_append_if_new_deduplicates_by_normalized_record_location(tmp_path: Path) -> None:
-    """Verify _append_if_new skips duplicate locations.
+def test_make_nested_record_returns_none_without_detector_match(tmp_path: Path) -> None:
+    """Verify _make_nested_record only builds records for matching folders.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    project_dir = tmp_path / "repo"
-    project_dir.mkdir()
+    repo_root = tmp_path.resolve() / "repo"
+    nested_match = repo_root / "tools" / "cli"
+    nested_match.mkdir(parents=True)
+    nested_non_match = repo_root / "docs"
+    nested_non_match.mkdir()
 
-    scanner = RepositoryScanner(detectors=[])
-    records = []
-    seen_paths: set[Path] = set()
+    detector = _StubDetector({nested_match: _make_detection(source="nested-marker")})
+    scanner = RepositoryScanner(detectors=[detector])
 
-    detection = _make_detection()
+    github_url = "https://github.com/example/repo"
+    rec = scanner._make_nested_record(str(nested_match), str(repo_root), github_url)
 
-    record_a = scanner._build_record(
-        project_path=project_dir,
-        repo_root=project_dir,
-        parent_repo=None,
-        is_repo_root=True,
-        github_url="",
-        detection=detection,
-    )
-    # Same normalized path, but reconstructed independently.
-    record_b = scanner._build_record(
-        project_path=project_dir / ".",
-        repo_root=project_dir,
-        parent_repo=None,
-        is_repo_root=True,
-        github_url="",
-        detection=detection,
-    )
+    assert scanner._make_nested_record(str(nested_non_match), str(repo_root), github_url) is None
+    assert rec is not None
+    assert rec.location == str(nested_match)
+    assert rec.parent_repo == str(repo_root)
+    assert rec.repo_root == str(repo_root)
+    assert rec.is_repo_root is False
+    assert rec.detection_source == "nested-marker"
 
-    scanner._append_if_new(records, seen_paths, record_a)
-    scanner._append_if_new(records, seen_paths, record_b)
 
-    assert len(records) == 1
+_GIT_WRITTEN_CONFIG = (
+    "[submodule \"vendor/lib\"]\n"
+    "\turl = git@github.com:example/lib.git\n"
+    "# comment\n"
+    "[remote \"origin\"]\n"
+    "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+    "\tfetch = +refs/tags/*:refs/tags/*\n"
+    "\tURL = git@github.com:example/primary.git\n"
+    "[remote \"backup\"]\n"
+    "\turl = git@github.com:example/backup.git\n"
+)
+
+
+@pytest.mark.parametrize(
+    ("git_file", "config_text", "expected"),
+    [
+        pytest.param(
+            False,
+            "[core]\n"
+            "    repositoryformatversion = 0\n"
+            '[remote "origin"]\n'
+            "    url = git@github.com:example-org/demo-repo.git\n"
+            "    fetch = +refs/heads/*:refs/remotes/origin/*",
+            "https://github.com/example-org/demo-repo",
+            id="ssh",
+        ),
+        pytest.param(
+            False,
+            '[remote "origin"]\nurl = https://github.com/example-org/demo-repo.git\n',
+            "https://github.com/example-org/demo-repo",
+            id="https",
+        ),
+        pytest.param(
+            False,
+            _GIT_WRITTEN_CONFIG,
+            "https://github.com/example/primary",
+            id="git-written-first-remote",
+        ),
+        pytest.param(True, None, "", id="git-file"),
+        pytest.param(False, None, "", id="no-config"),
+        pytest.param(False, "[core]\nrepositoryformatversion = 0\n", "", id="no-remote"),
+    ],
+)
+def test_extract_github_url(
+    scanner: RepositoryScanner,
+    tmp_path: Path,
+    git_file: bool,
+    config_text: str | None,
+    expected: str,
+) -> None:
+    """Verify remote URLs are read from ``.git/config`` and normalized.
+
+    :param scanner: Shared detector-less scanner fixture.
+    :type scanner: RepositoryScanner
+    :param tmp_path: Temporary directory fixture.
+    :type tmp_path: Path
+    :param git_file: Use a ``.git`` file (worktree layout) instead of a directory.
+    :type git_file: bool
+    :param config_text: ``.git/config`` content, or ``None`` for no config file.
+    :type config_text: str | None
+    :param expected: Expected GitHub URL.
+    :type expected: str
+    :return: None
+    :rtype: None
+    """
+    repo_root = tmp_path / "repo"
+    git_path = repo_root / ".git"
+    if git_file:
+        repo_root.mkdir()
+        git_path.write_text("gitdir: /worktree/path\n", encoding="utf-8")
+    else:
+        git_path.mkdir(parents=True)
+    if config_text is not None:
+        (git_path / "config").write_text(config_text, encoding="utf-8")
+
+    assert scanner._extract_github_url(repo_root) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        pytest.param("git@github.com:org/repo.git", "https://github.com/org/repo", id="ssh"),
+        pytest.param("https://github.com/org/repo.git", "https://github.com/org/repo", id="https"),
+        pytest.param(" https://github.com/org/repo ", "https://github.com/org/repo", id="padded"),
+        pytest.param(
+            "https://gitlab.com/org/repo.git", "https://gitlab.com/org/repo.git", id="non-github"
+        ),
+    ],
+)
+def test_normalize_remote_url_handles_known_formats(raw: str, expected: str) -> None:
+    """Verify _normalize_remote_url normalizes expected GitHub URL formats.
+
+    :param raw: Remote URL as written in Git config.
+    :type raw: str
+    :param expected: Expected normalized URL.
+    :type expected: str
+    :return: None
+    :rtype: None
+    """
+    assert RepositoryScanner._normalize_remote_url(raw) == expected
 
 
-def test_scan_nested_projects_detects_children_and_skips_repo_root(tmp_path: Path) -> None:
-    """Verify _scan_nested_projects returns only nested matches.
+def test_scan_end_to_end_returns_repo_root_and_nested_project(tmp_path: Path) -> None:
+    """Verify scan() returns repo root and nested project records sorted by location.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    repo_root = tmp_path / "repo"
-    (repo_root / ".git").mkdir(parents=True)
-
-    nested_match = repo_root / "tools" / "cli"
-    nested_match.mkdir(parents=True)
+    root = tmp_path.resolve() / "workspace"
+    repo_root = root / "repo"
+    nested_project = repo_root / "packages" / "tool"
 
-    nested_non_match = repo_root / "docs"
-    nested_non_match.mkdir()
+    # The git config populates github_url.
+    _mktree(
+        repo_root,
+        dirs=["packages/tool"],
+        files={".git/config": '[remote "origin"]\nurl = git@github.com:example/repo.git\n'},
+    )
 
-    # Also make repo root look like a project, to ensure _scan_nested_projects skips root itself.
-    root_detection = _make_detection(project_type="Script", source="root-marker")
-    nested_detection = _make_detection(project_type="CLI Tool", source="nested-marker")
+    repo_detection = _make_detection(
+        project_type="Repository App",
+        language="Python",
+        keywords=("python", "pyproject"),
+        source="repo-detect",
+    )
+    nested_detection = _make_detection(
+        project_type="CLI Tool",
+        language="Python",
+        keywords=("python", "src-layout"),
+        source="nested-detect",
+    )
 
     detector = _StubDetector(
         {
-            repo_root: root_detection,
-            nested_match: nested_detection,
+            repo_root: repo_detection,
+            nested_project: nested_detection,
         }
     )
     scanner = RepositoryScanner(detectors=[detector])
 
-    nested_records = scanner._scan_nested_projects(
-        repo_root=repo_root,
-        github_url="https://github.com/example/repo",
-    )
-
-    assert len(nested_records) == 1
-    rec = nested_records[0]
-    assert rec.location == str(nested_match.resolve())
-    assert rec.parent_repo == str(repo_root.resolve())
-    assert rec.repo_root == str(repo_root.resolve())
-    assert rec.is_repo_root is False
-    assert rec.detection_source == "nested-marker"
-
+    records = scanner.scan(root)
 
-def test_extract_github_url_from_git_config_ssh_is_normalized(tmp_path: Path) -> None:
-    """Verify SSH GitHub remotes are normalized to HTTPS.
+    assert len(records) == 2
 
-    :param tmp_path: Temporary directory fixture.
-    :type tmp_path: Path
-    :return: None
-    :rtype: None
-    """
-    repo_root = tmp_path / "repo"
-    git_dir = repo_root / ".git"
-    git_dir.mkdir(parents=True)
-
-    config_text = """
-[core]
-    repositoryformatversion = 0
-[remote "origin"]
-    url = git@github.com:example-org/demo-repo.git
-    fetch = +refs/heads/*:refs/remotes/origin/*
-"""
-    (git_dir / "config").write_text(config_text.strip(), encoding="utf-8")
+    # Sorted by location
+    assert records[0].location <= records[1].location
 
-    scanner = RepositoryScanner(detectors=[])
+    repo_record = next(r for r in records if r.is_repo_root)
+    nested_record = next(r for r in records if not r.is_repo_root)
 
-    url = scanner._extract_github_url(repo_root)
+    assert repo_record.location == str(repo_root)
+    assert repo_record.parent_repo == ""
+    assert repo_record.repo_root == str(repo_root)
+    assert repo_record.github_url == "https://github.com/example/repo"
+    assert "repo-root" in repo_record.keywords
+    assert repo_record.detection_source == "repo-detect"
 
-    assert url == "https://github.com/example-org/demo-repo"
+    assert nested_record.location == str(nested_project)
+    assert nested_record.parent_repo == str(repo_root)
+    assert nested_record.repo_root == str(repo_root)
+    assert nested_record.github_url == "https://github.com/example/repo"
+    assert "nested-project" in nested_record.keywords
+    assert nested_record.detection_source == "nested-detect"
 
 
-def test_extract_github_url_from_git_config_https_strips_dot_git(tmp_path: Path) -> None:
-    """Verify HTTPS GitHub remotes have trailing .git removed.
+def test_scan_attributes_projects_to_nearest_repo_root(tmp_path: Path) -> None:
+    """Verify nested repositories own the projects beneath them.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    repo_root = tmp_path / "repo"
-    git_dir = repo_root / ".git"
-    git_dir.mkdir(parents=True)
-
-    (git_dir / "config").write_text(
-        '[remote "origin"]\nurl = https://github.com/example-org/demo-repo.git\n',
-        encoding="utf-8",
+    root = tmp_path.resolve() / "workspace"
+    outer = root / "outer"
+    inner = outer / "vendor" / "inner"
+    outer_project = outer / "app"
+    inner_project = inner / "lib"
+    sibling_project = root / "loose"
+
+    _mktree(
+        root,
+        dirs=[
+            "outer/.git",
+            "outer/app",
+            "outer/vendor/inner/.git",
+            "outer/vendor/inner/lib",
+            "loose",
+        ],
     )
 
-    scanner = RepositoryScanner(detectors=[])
+    detector = _StubDetector(
+        {
+            outer_project: _make_detection(source="outer-app"),
+            inner_project: _make_detection(source="inner-lib"),
+            sibling_project: _make_detection(source="outside-repo"),
+        }
+    )
+    scanner = RepositoryScanner(detectors=[detector])
 
-    url = scanner._extract_github_url(repo_root)
+    records = {record.location: record for record in scanner.scan(root)}
 
-    assert url == "https://github.com/example-org/demo-repo"
+    assert set(records) == {
+        str(outer),
+        str(outer_project),
+        str(inner),
+        str(inner_project),
+    }
+    assert records[str(inner)].is_repo_root is True
+    assert records[str(outer_project)].parent_repo == str(outer)
+    assert records[str(inner_project)].parent_repo == str(inner)
 
 
-def test_extract_github_url_returns_empty_for_git_file_layout(tmp_path: Path) -> None:
-    """Verify git-file repository layout returns empty URL.
+def test_scan_results_do_not_depend_on_worker_count(tmp_path: Path) -> None:
+    """Verify parallel and single-threaded scans return identical records.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    repo_root = tmp_path / "repo"
-    repo_root.mkdir()
-    (repo_root / ".git").write_text("gitdir: /worktree/path\n", encoding="utf-8")
+    root = tmp_path / "workspace"
+    mapping: dict[Path, DetectionResult] = {}
+    for repo_index in range(4):
+        repo_root = root / f"repo-{repo_index}"
+        (repo_root / ".git").mkdir(parents=True)
+        for project_index in range(5):
+            project = repo_root / "packages" / f"pkg-{project_index}"
+            project.mkdir(parents=True)
+            mapping[project] = _make_detection(source=f"marker-{project_index}")
 
-    scanner = RepositoryScanner(detectors=[])
+    detector = _StubDetector(mapping)
+
+    sequential = RepositoryScanner(detectors=[detector], max_workers=1).scan(root)
+    parallel = RepositoryScanner(detectors=[detector], max_workers=8).scan(root)
 
-    assert scanner._extract_github_url(repo_root) == ""
+    assert len(sequential) == 24
+    assert parallel == sequential
 
 
-def test_extract_github_url_returns_empty_when_no_config_or_no_remote(tmp_path: Path) -> None:
-    """Verify missing config or missing remote URL returns empty string.
+def test_scan_orders_case_only_siblings_deterministically(tmp_path: Path) -> None:
+    """Verify folders whose names differ only in case sort by exact path.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    scanner = RepositoryScanner(detectors=[])
+    repo = tmp_path.resolve() / "repo"
+    _mktree(repo, dirs=[".git", "App"])
+    if (repo / "app").exists():
+        pytest.skip("filesystem is case-insensitive")
+    (repo / "app").mkdir()
 
-    repo_no_config = tmp_path / "repo1"
-    (repo_no_config / ".git").mkdir(parents=True)
-    assert scanner._extract_github_url(repo_no_config) == ""
+    detector = _StubDetector(
+        {
+            repo / "App": _make_detection(source="upper"),
+            repo / "app": _make_detection(source="lower"),
+        }
+    )
+    scanner = RepositoryScanner(detectors=[detector], max_workers=8)
 
-    repo_no_remote = tmp_path / "repo2"
-    git_dir = repo_no_remote / ".git"
-    git_dir.mkdir(parents=True)
-    (git_dir / "config").write_text("[core]\nrepositoryformatversion = 0\n", encoding="utf-8")
-    assert scanner._extract_github_url(repo_no_remote) == ""
+    for _ in range(5):
+        records = scanner.scan(repo)
+        assert [record.location for record in records] == [
+            str(repo),
+            str(repo / "App"),
+            str(repo / "app"),
+        ]
 
 
-def test_normalize_remote_url_handles_known_formats() -> None:
-    """Verify _normalize_remote_url normalizes expected GitHub URL formats.
+def test_init_rejects_non_positive_max_workers() -> None:
+    """Verify the scanner requires at least one worker thread.
 
     :return: None
     :rtype: None
     """
-    scanner = RepositoryScanner(detectors=[])
+    with pytest.raises(ValueError, match="max_workers"):
+        RepositoryScanner(detectors=[], max_workers=0)
 
-    assert (
-        scanner._normalize_remote_url("git@github.com:org/repo.git")
-        == "https://github.com/org/repo"
-    )
-    assert (
-        scanner._normalize_remote_url("https://github.com/org/repo.git")
-        == "https://github.com/org/repo"
-    )
-    assert scanner._normalize_remote_url(" https://github.com/org/repo ") == (
-        "https://github.com/org/repo"
-    )
-    assert scanner._normalize_remote_url("https://gitlab.com/org/repo.git") == (
-        "https://gitlab.com/org/repo.git"
-    )
 
-
-def test_scan_end_to_end_returns_repo_root_and_nested_project(tmp_path: Path) -> None:
-    """Verify scan() returns repo root and nested project records sorted by location.
+def test_scan_prune_flat_repos_skips_repos_without_nested_hints(tmp_path: Path) -> None:
+    """Verify flat repositories are pruned only when pruning is enabled.
 
     :param tmp_path: Temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    root = tmp_path / "workspace"
-    repo_root = root / "repo"
-    nested_project = repo_root / "packages" / "tool"
-
-    (repo_root / ".git").mkdir(parents=True)
-    nested_project.mkdir(parents=True)
-
-    # Add git config so github_url gets populated.
-    (repo_root / ".git" / "config").write_text(
-        '[remote "origin"]\nurl = git@github.com:example/repo.git\n',
-        encoding="utf-8",
-    )
-
-    repo_detection = _make_detection(
-        project_type="Repository App",
-        language="Python",
-        keywords=["python", "pyproject"],
-        source="repo-detect",
-    )
-    nested_detection = _make_detection(
-        project_type="CLI Tool",
-        language="Python",
-        keywords=["python", "src-layout"],
-        source="nested-detect",
+    root = tmp_path.resolve() / "workspace"
+    flat_repo = root / "flat"
+    deep_project = flat_repo / "src" / "deep"
+    mono_repo = root / "mono"
+    mono_project = mono_repo / "packages" / "pkg"
+    hinted_repo = root / "hinted"
+    hinted_project = hinted_repo / "app"
+    hinted_deep_project = hinted_project / "plugins" / "extra"
+
+    _mktree(
+        root,
+        dirs=[
+            "flat/.git",
+            "flat/src/deep",
+            "mono/.git",
+            "mono/packages/pkg",
+            "hinted/.git",
+            "hinted/app/plugins/extra",
+        ],
     )
 
     detector = _StubDetector(
         {
-            repo_root: repo_detection,
-            nested_project: nested_detection,
+            deep_project: _make_detection(source="deep"),
+            mono_project: _make_detection(source="mono"),
+            hinted_project: _make_detection(source="hinted"),
+            hinted_deep_project: _make_detection(source="hinted-deep"),
         }
     )
-    scanner = RepositoryScanner(detectors=[detector])
 
-    records = scanner.scan(root)
+    full = {record.location for record in RepositoryScanner(detectors=[detector]).scan(root)}
+    pruned = {
+        record.location
+        for record in RepositoryScanner(detectors=[detector], prune_flat_repos=True).scan(root)
+    }
 
-    assert len(records) == 2
+    assert str(deep_project) in full
+    assert pruned == full - {str(deep_project)}
 
-    # Sorted by location
-    assert records[0].location <= records[1].location
 
-    repo_record = next(r for r in records if r.is_repo_root)
-    nested_record = next(r for r in records if not r.is_repo_root)
+def test_scan_prune_flat_repos_lists_each_folder_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Verify the nested-hint check hands its child listings to the walk.
 
-    assert repo_record.location == str(repo_root.resolve())
-    assert repo_record.parent_repo == ""
-    assert repo_record.repo_root == str(repo_root.resolve())
-    assert repo_record.github_url == "https://github.com/example/repo"
-    assert "repo-root" in repo_record.keywords
-    assert repo_record.detection_source == "repo-detect"
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
+    :param tmp_path: Temporary directory fixture.
+    :type tmp_path: Path
+    :return: None
+    :rtype: None
+    """
+    repo = tmp_path.resolve() / "repo"
+    _mktree(repo, dirs=[".git", "docs", "lib/plugins", "src"])
 
-    assert nested_record.location == str(nested_project.resolve())
-    assert nested_record.parent_repo == str(repo_root.resolve())
-    assert nested_record.repo_root == str(repo_root.resolve())
-    assert nested_record.github_url == "https://github.com/example/repo"
-    assert "nested-project" in nested_record.keywords
-    assert nested_record.detection_source == "nested-detect"
\ No newline at end of file
+    listed: list[str] = []
+    original_list = RepositoryScanner._list_folder
+
+    def counting_list(folder: str) -> tuple[FolderIndex | None, list[str]]:
+        """Record each folder listing before delegating."""
+        listed.append(folder)
+        return original_list(folder)
+
+    monkeypatch.setattr(RepositoryScanner, "_list_folder", staticmethod(counting_list))
+
+    detector = _StubDetector({repo / "src": _make_detection(source="hint")})
+    scanner = RepositoryScanner(detectors=[detector], prune_flat_repos=True)
+    records = scanner.scan(repo)
+
+    assert [record.location for record in records] == [str(repo), str(repo / "src")]
+    assert sorted(listed) == sorted(
+        str(folder)
+        for folder in (repo, repo / "docs", repo / "lib", repo / "lib" / "plugins", repo / "src")
+    )
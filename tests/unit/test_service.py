@@ -2,55 +2,66 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from unittest.mock import Mock, patch
 
 import pytest
 
+from code_inventory.csv_writer import CsvInventoryWriter
+from code_inventory.scanner import RepositoryScanner
 from code_inventory.service import InventoryService
 
 
-class _FakeScanner:
-    """Fake repository scanner for service tests."""
+def _make_scanner(records: Sequence[object] = ()) -> Mock:
+    """Return a mock repository scanner whose scan returns ``records``.
 
-    def __init__(self, records: list[object] | None = None) -> None:
-        """Initialize the fake scanner.
-
-        :param records: Records to return from ``scan``.
-        :type records: list[object] | None
-        """
-        self.records = records if records is not None else []
-        self.calls: list[Path] = []
+    :param records: Records to return from ``scan``.
+    :type records: Sequence[object]
+    :return: Mock spec'd against ``RepositoryScanner``.
+    :rtype: Mock
+    """
+    scanner = Mock(spec=RepositoryScanner)
+    scanner.scan.return_value = list(records)
+    return scanner
 
-    def scan(self, input_folder: Path) -> list[object]:
-        """Return predefined records and capture the call.
 
-        :param input_folder: Input folder passed by the service.
-        :type input_folder: Path
-        :return: Fake records.
-        :rtype: list[object]
-        """
-        self.calls.append(input_folder)
-        return self.records
+def _make_writer() -> Mock:
+    """Return a mock CSV writer.
 
+    :return: Mock spec'd against ``CsvInventoryWriter``.
+    :rtype: Mock
+    """
+    return Mock(spec=CsvInventoryWriter)
 
-class _FakeWriter:
-    """Fake CSV writer for service tests."""
 
-    def __init__(self) -> None:
-        """Initialize fake writer call capture."""
-        self.calls: list[tuple[Path, list[object]]] = []
+class _UnlistablePath(type(Path())):  # type: ignore[misc]
+    """Path whose directory listing always fails."""
 
-    def write(self, output_csv: Path, records: list[object]) -> None:
-        """Capture write calls.
+    def iterdir(self) -> Iterator[Path]:
+        """Raise OSError instead of listing the directory.
 
-        :param output_csv: Output CSV path.
-        :type output_csv: Path
-        :param records: Records passed by the service.
-        :type records: list[object]
-        :return: None
-        :rtype: None
+        :return: Never returns.
+        :rtype: Iterator[Path]
+        :raises OSError: Always.
         """
-        self.calls.append((output_csv, records))
+        raise OSError("permission denied")
+
+
+@pytest.fixture(scope="module")
+def shared_workspace(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return an existing input folder shared by the module's tests.
+
+    The fake scanner never reads the folder, so tests only need it to exist.
+    Output paths stay under each test's own ``tmp_path``.
+
+    :param tmp_path_factory: Pytest session temporary directory factory.
+    :type tmp_path_factory: pytest.TempPathFactory
+    :return: Existing, empty input folder.
+    :rtype: Path
+    """
+    return tmp_path_factory.mktemp("workspace")
 
 
 def test_init_uses_injected_dependencies() -> None:
@@ -59,8 +70,8 @@ def test_init_uses_injected_dependencies() -> None:
     :return: None
     :rtype: None
     """
-    scanner = _FakeScanner()
-    writer = _FakeWriter()
+    scanner = _make_scanner()
+    writer = _make_writer()
 
     service = InventoryService(scanner=scanner, writer=writer)
 
@@ -68,179 +79,203 @@ def test_init_uses_injected_dependencies() -> None:
     assert service._writer is writer  # noqa: SLF001
 
 
-def test_run_happy_path_calls_scanner_and_writer_with_resolved_paths(tmp_path: Path) -> None:
+def test_run_happy_path_calls_scanner_and_writer_with_resolved_paths(
+    shared_workspace: Path,
+    tmp_path: Path,
+) -> None:
     """Verify run() validates paths, scans, writes CSV, and returns record count.
 
+    :param shared_workspace: Shared existing input folder.
+    :type shared_workspace: Path
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
-
+    input_dir = shared_workspace
     output_csv = tmp_path / "out" / "inventory.csv"
 
     fake_records = [{"project_name": "alpha"}, {"project_name": "beta"}]
-    scanner = _FakeScanner(records=fake_records)
-    writer = _FakeWriter()
+    scanner = _make_scanner(fake_records)
+    writer = _make_writer()
 
     service = InventoryService(scanner=scanner, writer=writer)
 
     count = service.run(input_folder=input_dir, output_csv=output_csv)
 
     assert count == 2
-    assert scanner.calls == [input_dir.resolve()]
-    assert len(writer.calls) == 1
+    scanner.scan.assert_called_once_with(input_dir.resolve())
+    writer.write.assert_called_once_with(output_csv.resolve(), fake_records)
 
-    called_output, called_records = writer.calls[0]
-    assert called_output == output_csv.resolve()
-    assert called_records == fake_records
 
-
-def test_run_raises_file_not_found_for_missing_input(tmp_path: Path) -> None:
-    """Verify run() raises FileNotFoundError for missing input folder.
+def _missing_input(tmp_path: Path, workspace: Path) -> tuple[Path, Path, str | None]:
+    """Lay out an input folder that does not exist.
 
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :return: None
-    :rtype: None
+    :param workspace: Shared existing input folder.
+    :type workspace: Path
+    :return: Input folder, output CSV path, and no service check to stub.
+    :rtype: tuple[Path, Path, str | None]
     """
-    missing_input = tmp_path / "missing"
-    output_csv = tmp_path / "inventory.csv"
+    return tmp_path / "missing", tmp_path / "inventory.csv", None
 
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
 
-    with pytest.raises(FileNotFoundError, match="Input folder does not exist"):
-        service.run(input_folder=missing_input, output_csv=output_csv)
-
-
-def test_run_raises_not_a_directory_for_input_file(tmp_path: Path) -> None:
-    """Verify run() raises NotADirectoryError when input path is a file.
+def _input_is_file(tmp_path: Path, workspace: Path) -> tuple[Path, Path, str | None]:
+    """Lay out an input path that is a regular file.
 
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :return: None
-    :rtype: None
+    :param workspace: Shared existing input folder.
+    :type workspace: Path
+    :return: Input path, output CSV path, and no service check to stub.
+    :rtype: tuple[Path, Path, str | None]
     """
     input_file = tmp_path / "not_a_folder.txt"
-    input_file.write_text("x", encoding="utf-8")
-
-    output_csv = tmp_path / "inventory.csv"
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
+    input_file.touch()
+    return input_file, tmp_path / "inventory.csv", None
 
-    with pytest.raises(NotADirectoryError, match="Input path is not a directory"):
-        service.run(input_folder=input_file, output_csv=output_csv)
 
+def _unreadable_input(tmp_path: Path, workspace: Path) -> tuple[Path, Path, str | None]:
+    """Lay out an input folder whose readability check is stubbed to fail.
 
-def test_run_raises_permission_error_when_input_not_readable(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Verify run() raises PermissionError when input folder is unreadable.
-
-    :param monkeypatch: Pytest monkeypatch fixture.
-    :type monkeypatch: pytest.MonkeyPatch
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :return: None
-    :rtype: None
+    :param workspace: Shared existing input folder.
+    :type workspace: Path
+    :return: Input folder, output CSV path, and the service check to stub.
+    :rtype: tuple[Path, Path, str | None]
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
+    return workspace, tmp_path / "inventory.csv", "_is_readable_dir"
 
-    output_csv = tmp_path / "inventory.csv"
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
 
-    monkeypatch.setattr(service, "_is_readable_dir", lambda path: False)
-
-    with pytest.raises(PermissionError, match="Input folder is not readable"):
-        service.run(input_folder=input_dir, output_csv=output_csv)
-
-
-def test_run_raises_not_a_directory_when_output_parent_is_file(tmp_path: Path) -> None:
-    """Verify run() raises NotADirectoryError if output parent exists as a file.
+def _output_parent_is_file(tmp_path: Path, workspace: Path) -> tuple[Path, Path, str | None]:
+    """Lay out an output path whose parent exists as a regular file.
 
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :return: None
-    :rtype: None
+    :param workspace: Shared existing input folder.
+    :type workspace: Path
+    :return: Input folder, output CSV path, and no service check to stub.
+    :rtype: tuple[Path, Path, str | None]
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
-
     fake_parent = tmp_path / "not_a_dir"
-    fake_parent.write_text("x", encoding="utf-8")
-
-    output_csv = fake_parent / "inventory.csv"
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
-
-    with pytest.raises(NotADirectoryError, match="Output parent path is not a directory"):
-        service.run(input_folder=input_dir, output_csv=output_csv)
+    fake_parent.touch()
+    return workspace, fake_parent / "inventory.csv", None
 
 
-def test_run_raises_permission_error_when_output_parent_not_writable(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
-    """Verify run() raises PermissionError when output directory is not writable.
+def _unwritable_output_parent(tmp_path: Path, workspace: Path) -> tuple[Path, Path, str | None]:
+    """Lay out an output folder whose writability check is stubbed to fail.
 
-    :param monkeypatch: Pytest monkeypatch fixture.
-    :type monkeypatch: pytest.MonkeyPatch
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
-    :return: None
-    :rtype: None
+    :param workspace: Shared existing input folder.
+    :type workspace: Path
+    :return: Input folder, output CSV path, and the service check to stub.
+    :rtype: tuple[Path, Path, str | None]
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
-
     output_parent = tmp_path / "out"
     output_parent.mkdir()
-    output_csv = output_parent / "inventory.csv"
-
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
-    monkeypatch.setattr(service, "_is_writable_dir", lambda path: False)
-
-    with pytest.raises(PermissionError, match="Output directory is not writable"):
-        service.run(input_folder=input_dir, output_csv=output_csv)
-
-
-def test_validate_input_folder_accepts_valid_readable_directory(tmp_path: Path) -> None:
-    """Verify _validate_input_folder succeeds for a valid readable directory.
+    return workspace, output_parent / "inventory.csv", "_is_writable_dir"
+
+
+@pytest.mark.parametrize(
+    ("setup", "exc", "match"),
+    [
+        pytest.param(
+            _missing_input,
+            FileNotFoundError,
+            re.compile("Input folder does not exist"),
+            id="missing_input",
+        ),
+        pytest.param(
+            _input_is_file,
+            NotADirectoryError,
+            re.compile("Input path is not a directory"),
+            id="input_is_file",
+        ),
+        pytest.param(
+            _unreadable_input,
+            PermissionError,
+            re.compile("Input folder is not readable"),
+            id="unreadable_input",
+        ),
+        pytest.param(
+            _output_parent_is_file,
+            NotADirectoryError,
+            re.compile("Output parent path is not a directory"),
+            id="output_parent_is_file",
+        ),
+        pytest.param(
+            _unwritable_output_parent,
+            PermissionError,
+            re.compile("Output directory is not writable"),
+            id="unwritable_output_parent",
+        ),
+    ],
+)
+def test_run_raises_for_invalid_paths(
+    shared_workspace: Path,
+    tmp_path: Path,
+    setup: Callable[[Path, Path], tuple[Path, Path, str | None]],
+    exc: type[OSError],
+    match: re.Pattern[str],
+) -> None:
+    """Verify run() rejects invalid input and output paths before scanning.
 
+    :param shared_workspace: Shared existing input folder.
+    :type shared_workspace: Path
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
+    :param setup: Builds the paths and names the service check to stub.
+    :type setup: Callable[[Path, Path], tuple[Path, Path, str | None]]
+    :param exc: Expected exception type.
+    :type exc: type[OSError]
+    :param match: Expected message pattern, compiled once at import.
+    :type match: re.Pattern[str]
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
+    input_folder, output_csv, failing_check = setup(tmp_path, shared_workspace)
+    service = InventoryService(scanner=_make_scanner(), writer=_make_writer())
+    if failing_check is not None:
+        # The service is local to this test, so the stub needs no undo.
+        setattr(service, failing_check, lambda path: False)
 
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
+    with pytest.raises(exc, match=match):
+        service.run(input_folder=input_folder, output_csv=output_csv)
 
-    service._validate_input_folder(input_dir)
 
+def test_validators_accept_valid_paths(shared_workspace: Path) -> None:
+    """Verify both validators accept valid input and output paths.
 
-def test_validate_output_path_allows_nonexistent_parent(tmp_path: Path) -> None:
-    """Verify _validate_output_path allows a missing parent directory.
+    The output validator allows a missing parent directory because the
+    writer creates it later.
 
-    Writer is responsible for creating the directory later.
-
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
+    :param shared_workspace: Shared existing input folder.
+    :type shared_workspace: Path
     :return: None
     :rtype: None
     """
-    output_csv = tmp_path / "new" / "nested" / "inventory.csv"
-    service = InventoryService(scanner=_FakeScanner(), writer=_FakeWriter())
+    service = InventoryService(scanner=_make_scanner(), writer=_make_writer())
 
-    service._validate_output_path(output_csv)
+    service._validate_input_folder(shared_workspace)
+    service._validate_output_path(shared_workspace / "new" / "nested" / "inventory.csv")
 
 
-def test_is_readable_dir_returns_true_for_readable_directory(tmp_path: Path) -> None:
-    """Verify _is_readable_dir returns True for normal directories.
+@pytest.mark.parametrize(
+    "check",
+    [InventoryService._is_readable_dir, InventoryService._is_writable_dir],
+    ids=["readable", "writable"],
+)
+def test_dir_checks_return_true_for_accessible_directory(
+    check: Callable[[Path], bool],
+    tmp_path: Path,
+) -> None:
+    """Verify the readability and writability checks accept a normal directory.
 
+    :param check: Static directory check under test.
+    :type check: Callable[[Path], bool]
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
     :return: None
@@ -250,17 +285,12 @@ def test_is_readable_dir_returns_true_for_readable_directory(tmp_path: Path) ->
     folder.mkdir()
     (folder / "file.txt").write_text("hello", encoding="utf-8")
 
-    assert InventoryService._is_readable_dir(folder) is True
+    assert check(folder) is True
 
 
-def test_is_readable_dir_returns_false_when_iterdir_raises(
-    monkeypatch: pytest.MonkeyPatch,
-    tmp_path: Path,
-) -> None:
+def test_is_readable_dir_returns_false_when_iterdir_raises(tmp_path: Path) -> None:
     """Verify _is_readable_dir returns False when directory iteration fails.
 
-    :param monkeypatch: Pytest monkeypatch fixture.
-    :type monkeypatch: pytest.MonkeyPatch
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
     :return: None
@@ -269,21 +299,11 @@ def test_is_readable_dir_returns_false_when_iterdir_raises(
     folder = tmp_path / "folder"
     folder.mkdir()
 
-    original_iterdir = Path.iterdir
-
-    def fake_iterdir(self: Path):
-        """Raise OSError for the target path only."""
-        if self == folder:
-            raise OSError("permission denied")
-        return original_iterdir(self)
-
-    monkeypatch.setattr(Path, "iterdir", fake_iterdir)
-
-    assert InventoryService._is_readable_dir(folder) is False
+    assert InventoryService._is_readable_dir(_UnlistablePath(folder)) is False
 
 
-def test_is_writable_dir_returns_true_for_writable_directory(tmp_path: Path) -> None:
-    """Verify _is_writable_dir returns True for writable directories.
+def test_is_writable_dir_returns_false_when_touch_fails(tmp_path: Path) -> None:
+    """Verify _is_writable_dir returns False when temp file creation fails.
 
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
@@ -293,73 +313,70 @@ def test_is_writable_dir_returns_true_for_writable_directory(tmp_path: Path) ->
     folder = tmp_path / "folder"
     folder.mkdir()
 
-    assert InventoryService._is_writable_dir(folder) is True
+    with patch.object(Path, "touch", side_effect=OSError("read-only file system")) as touch:
+        assert InventoryService._is_writable_dir(folder) is False
 
+    touch.assert_called_once_with(exist_ok=False)
 
-def test_is_writable_dir_returns_false_when_touch_fails(
-    monkeypatch: pytest.MonkeyPatch,
+
+def test_run_propagates_writer_oserror(
+    shared_workspace: Path,
     tmp_path: Path,
 ) -> None:
-    """Verify _is_writable_dir returns False when temp file creation fails.
+    """Verify run() propagates writer OSError to caller.
 
-    :param monkeypatch: Pytest monkeypatch fixture.
-    :type monkeypatch: pytest.MonkeyPatch
+    :param shared_workspace: Shared existing input folder.
+    :type shared_workspace: Path
     :param tmp_path: Pytest temporary directory fixture.
     :type tmp_path: Path
     :return: None
     :rtype: None
     """
-    folder = tmp_path / "folder"
-    folder.mkdir()
-
-    original_touch = Path.touch
+    input_dir = shared_workspace
+    output_csv = tmp_path / "out" / "inventory.csv"
 
-    def fake_touch(self: Path, *args: object, **kwargs: object) -> None:
-        """Raise OSError for the service temp file only."""
-        if self.name == ".code_inventory_write_test.tmp":
-            raise OSError("read-only file system")
-        original_touch(self, *args, **kwargs)
+    scanner = _make_scanner([{"project": "x"}])
+    writer = _make_writer()
+    writer.write.side_effect = OSError("disk full")
 
-    monkeypatch.setattr(Path, "touch", fake_touch)
+    service = InventoryService(scanner=scanner, writer=writer)
 
-    assert InventoryService._is_writable_dir(folder) is False
+    with pytest.raises(OSError, match="disk full"):
+        service.run(input_folder=input_dir, output_csv=output_csv)
 
 
-def test_run_propagates_writer_oserror(
-    tmp_path: Path,
+def test_run_passes_dash_output_through_without_validation(
+    shared_workspace: Path,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Verify run() propagates writer OSError to caller.
+    """Verify ``-`` output is handed to the writer unresolved and unvalidated.
 
-    :param tmp_path: Pytest temporary directory fixture.
-    :type tmp_path: Path
+    :param shared_workspace: Shared existing input folder.
+    :type shared_workspace: Path
+    :param monkeypatch: Pytest monkeypatch fixture.
+    :type monkeypatch: pytest.MonkeyPatch
     :return: None
     :rtype: None
     """
-    input_dir = tmp_path / "workspace"
-    input_dir.mkdir()
-
-    output_csv = tmp_path / "out" / "inventory.csv"
+    input_dir = shared_workspace
 
-    scanner = _FakeScanner(records=[{"project": "x"}])
+    def fail_validation(self: InventoryService, output_csv: Path) -> None:
+        """Fail if output validation runs.
 
-    class _FailingWriter(_FakeWriter):
-        """Fake writer that raises OSError."""
+        :param self: Service instance.
+        :type self: InventoryService
+        :param output_csv: Output CSV path.
+        :type output_csv: Path
+        :return: None
+        :rtype: None
+        """
+        raise AssertionError(f"unexpected output validation for {output_csv}")
 
-        def write(self, output_csv: Path, records: list[object]) -> None:
-            """Raise OSError during write.
+    monkeypatch.setattr(InventoryService, "_validate_output_path", fail_validation)
 
-            :param output_csv: Output path.
-            :type output_csv: Path
-            :param records: Records.
-            :type records: list[object]
-            :return: None
-            :rtype: None
-            :raises OSError: Always.
-            """
-            _ = output_csv, records
-            raise OSError("disk full")
+    writer = _make_writer()
+    service = InventoryService(scanner=_make_scanner(), writer=writer)
 
-    service = InventoryService(scanner=scanner, writer=_FailingWriter())
+    service.run(input_folder=input_dir, output_csv=Path("-"))
 
-    with pytest.raises(OSError, match="disk full"):
-        service.run(input_folder=input_dir, output_csv=output_csv)
\ No newline at end of file
+    writer.write.assert_called_once_with(Path("-"), [])